@@ -7,11 +7,95 @@ import requests
 import json
 import logging
 import math
-from typing import Dict, List, Optional, Any, Tuple
-from urllib.parse import urlencode
+import random
+import threading
+import time
+from typing import Dict, List, Optional, Any, Tuple, Union
+from urllib.parse import urlencode, quote
+
+from config import Config
+from utils.constants import UNIT_CONVERSIONS
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+M2_TO_FT2 = UNIT_CONVERSIONS['sqm_to_sqft']
+
+# HTTP statuses that mean "slow down / try again later"
+RETRYABLE_STATUS_CODES = (429, 503)
+
+def _ring_centroid(ring) -> Tuple[float, float]:
+    """
+    Area-weighted (signed-area) centroid of a polygon ring.
+    Falls back to the vertex mean for degenerate (zero-area) rings.
+    """
+    n = len(ring)
+    area2 = 0.0
+    cx = 0.0
+    cy = 0.0
+    sum_x = 0.0
+    sum_y = 0.0
+    for i in range(n):
+        x0 = ring[i][0]
+        y0 = ring[i][1]
+        j = i + 1 if i + 1 < n else 0
+        x1 = ring[j][0]
+        y1 = ring[j][1]
+        cross = x0 * y1 - x1 * y0
+        area2 += cross
+        cx += (x0 + x1) * cross
+        cy += (y0 + y1) * cross
+        sum_x += x0
+        sum_y += y0
+    if area2 == 0.0:
+        return sum_x / n, sum_y / n
+    return cx / (3.0 * area2), cy / (3.0 * area2)
+
+if NUMBA_AVAILABLE:
+    _ring_centroid_jit = njit(cache=True)(_ring_centroid)
+
+def polygon_centroid(ring: List[List[float]]) -> Tuple[float, float]:
+    """Centroid of an ArcGIS ring, JIT-compiled when numba is installed"""
+    if NUMBA_AVAILABLE:
+        cx, cy = _ring_centroid_jit(np.asarray(ring, dtype=np.float64))
+        return float(cx), float(cy)
+    return _ring_centroid(ring)
+
+class _TokenBucket:
+    """Thread-safe token bucket limiting requests to `rate` per second"""
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
 class ArcGISAPIClient:
     """ArcGIS REST API compliant client for Oakville GIS data"""
     
@@ -22,6 +106,9 @@ class ArcGISAPIClient:
             'User-Agent': 'OakvilleRealEstateAnalyzer/2.0',
             'Accept': 'application/json'
         })
+        self.max_retries = Config.MAX_RETRIES
+        self.retry_delay = Config.RETRY_DELAY
+        self._rate_limiter = _TokenBucket(Config.MAX_REQUESTS_PER_SECOND)
         
         # ArcGIS REST API endpoints (verified working)
         self.endpoints = {
@@ -29,14 +116,36 @@ class ArcGISAPIClient:
             'zoning': '/Zoning_By_law_2014_014/FeatureServer/10/query',
             'assessment_parcels': '/Assessment_Parcels/FeatureServer/0/query'
         }
+        
+        # Static part of the parcel address query, encoded once; only the
+        # WHERE clause changes between calls
+        self._parcel_query_static = urlencode({
+            'outFields': '*',  # Get all fields
+            'returnGeometry': 'true',  # Need geometry for zoning query
+            'f': 'json'
+        })
+        
+        # Zoning point query with everything but the coordinates
+        # pre-encoded; get_zoning_by_geometry only formats in X/Y
+        self._zoning_query_tmpl = urlencode({
+            'geometry': '{X},{Y}',
+            'geometryType': 'esriGeometryPoint',
+            'inSR': '26917',  # UTM Zone 17N (Oakville's coordinate system)
+            'spatialRel': 'esriSpatialRelIntersects',
+            'where': '1=1',  # Get all records
+            'outFields': 'ZONE,ZONE_DESC,CLASS,SP1,SP2,SP3,SP4,SP5,SP_DESC,FULL_ZONING_DESC,Shape__Area,Shape__Length',
+            'returnGeometry': 'false',
+            'f': 'json'
+        }).replace('%7BX%7D', '{X}').replace('%7BY%7D', '{Y}')
     
-    def _make_arcgis_request(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict]:
+    def _make_arcgis_request(self, endpoint: str, params: Union[Dict[str, Any], str]) -> Optional[Dict]:
         """
         Make ArcGIS REST API compliant request
         
         Args:
             endpoint: API endpoint key
-            params: Query parameters following ArcGIS specification
+            params: Query parameters following ArcGIS specification, or an
+                already URL-encoded query string
             
         Returns:
             JSON response or None if failed
@@ -47,14 +156,16 @@ class ArcGISAPIClient:
         url = self.base_url + self.endpoints[endpoint]
         
         try:
-            logger.info(f"ArcGIS API Request: {endpoint}")
-            response = self.session.get(url, params=params, timeout=30)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("ArcGIS API Request: %s", endpoint)
+            response = self._get_with_backoff(url, params)
             
             if response.status_code != 200:
                 logger.error(f"HTTP {response.status_code}: {response.text[:500]}")
                 return None
             
-            data = response.json()
+            # orjson parses the large 'rings' float arrays much faster
+            data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
             
             # Check for ArcGIS service errors
             if 'error' in data:
@@ -62,7 +173,8 @@ class ArcGISAPIClient:
                 return None
             
             if 'features' in data:
-                logger.info(f"Found {len(data['features'])} features")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Found %d features", len(data['features']))
                 return data
             else:
                 logger.warning("No features in response")
@@ -72,6 +184,37 @@ class ArcGISAPIClient:
             logger.error(f"API request failed: {e}")
             return None
     
+    def _get_with_backoff(self, url: str, params: Union[Dict[str, Any], str]) -> requests.Response:
+        """
+        Rate-limited GET that retries 429/503 responses, honouring
+        Retry-After and otherwise backing off exponentially with jitter.
+        Always makes at least one attempt, and caps any delay at the
+        largest backoff step so a huge Retry-After can't stall the caller
+        """
+        attempts = max(1, self.max_retries)
+        max_delay = self.retry_delay * (2 ** attempts)
+        for attempt in range(attempts):
+            self._rate_limiter.acquire()
+            if isinstance(params, str):
+                # Pre-encoded query string - skip requests' param encoding
+                response = self.session.get(f"{url}?{params}", timeout=30)
+            else:
+                response = self.session.get(url, params=params, timeout=30)
+            
+            if response.status_code not in RETRYABLE_STATUS_CODES or attempt == attempts - 1:
+                return response
+            
+            retry_after = response.headers.get('Retry-After')
+            try:
+                delay = float(retry_after)
+            except (TypeError, ValueError):
+                delay = self.retry_delay * (2 ** attempt) * random.uniform(0.5, 1.5)
+            delay = min(max(delay, 0.0), max_delay)
+            logger.warning(f"HTTP {response.status_code}, retrying in {delay:.1f}s (attempt {attempt + 1})")
+            time.sleep(delay)
+        
+        return response
+    
     def _wgs84_to_utm17n(self, lat: float, lon: float) -> Tuple[float, float]:
         """
         Convert WGS84 (lat/lon) to UTM Zone 17N (EPSG:26917)
@@ -124,16 +267,11 @@ class ArcGISAPIClient:
         clean_address = clean_address.replace(" STREET", " ST")
         clean_address = clean_address.replace(" ROAD", " RD")
         
-        # ArcGIS REST API query parameters
-        params = {
-            'where': f"ADDRESS LIKE '%{clean_address}%'",
-            'outFields': '*',  # Get all fields
-            'returnGeometry': 'true',  # Need geometry for zoning query
-            'f': 'json'
-        }
+        # ArcGIS REST API query: static fields pre-encoded, only WHERE varies
+        where = f"ADDRESS LIKE '%{clean_address}%'"
+        query = f"{self._parcel_query_static}&where={quote(where)}"
         
-        logger.info(f"Searching for address: {clean_address}")
-        data = self._make_arcgis_request('parcel_address', params)
+        data = self._make_arcgis_request('parcel_address', query)
         
         if data and data.get('features'):
             feature = data['features'][0]  # Take first match
@@ -147,16 +285,46 @@ class ArcGISAPIClient:
                 'geometry': geometry,
                 'shape_area': attributes.get('Shape__Area'),  # Lot area in m²
                 'shape_length': attributes.get('Shape__Length'),  # Perimeter in m
+                'zone': attributes.get('ZONE'),  # Present when the parcel view joins zoning
+                'zone_desc': attributes.get('ZONE_DESC'),
                 'source': 'oakville_parcel_api',
                 'api_verified': True
             }
+            if property_data['zone']:
+                property_data['zoning'] = self._extract_zoning(attributes, 'oakville_parcel_api')
             
-            logger.info(f"Found property: {property_data['address']}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Found property: %s", property_data['address'])
             return property_data
         
         logger.warning(f"No property found for address: {address}")
         return None
     
+    def _extract_zoning(self, attributes: Dict[str, Any], source: str) -> Dict[str, Any]:
+        """
+        Build zoning data from ArcGIS attributes (zoning layer or a parcel
+        view joined with zoning columns)
+        """
+        # Extract special provisions from SP1-SP5 fields
+        special_provisions = []
+        for i in range(1, 6):
+            sp_value = attributes.get(f'SP{i}')
+            if sp_value and str(sp_value).strip():
+                special_provisions.append(f"SP:{sp_value}")
+        
+        return {
+            'zone_code': attributes.get('ZONE', ''),
+            'zone_description': attributes.get('ZONE_DESC', ''),
+            'zone_class': attributes.get('CLASS', ''),
+            'special_provisions': special_provisions,
+            'special_provision_desc': attributes.get('SP_DESC', ''),
+            'full_zoning_desc': attributes.get('FULL_ZONING_DESC', ''),
+            'zone_shape_area': None,
+            'zone_shape_length': None,
+            'source': source,
+            'api_verified': True
+        }
+    
     def get_zoning_by_geometry(self, geometry: Dict) -> Optional[Dict]:
         """
         Get zoning data using property geometry
@@ -170,52 +338,27 @@ class ArcGISAPIClient:
         if not geometry or 'rings' not in geometry:
             return None
         
-        # Get centroid of property polygon
+        # Get centroid of property polygon (area-weighted, so it stays
+        # inside non-convex parcels better than the vertex mean)
         rings = geometry['rings'][0]  # First ring
-        x_coords = [point[0] for point in rings]
-        y_coords = [point[1] for point in rings]
-        centroid_x = sum(x_coords) / len(x_coords)
-        centroid_y = sum(y_coords) / len(y_coords)
+        centroid_x, centroid_y = polygon_centroid(rings)
         
-        # ArcGIS REST API spatial query parameters
-        params = {
-            'geometry': f'{centroid_x},{centroid_y}',
-            'geometryType': 'esriGeometryPoint',
-            'inSR': '26917',  # UTM Zone 17N (Oakville's coordinate system)
-            'spatialRel': 'esriSpatialRelIntersects',
-            'where': '1=1',  # Get all records
-            'outFields': 'ZONE,ZONE_DESC,CLASS,SP1,SP2,SP3,SP4,SP5,SP_DESC,FULL_ZONING_DESC,Shape__Area,Shape__Length',
-            'returnGeometry': 'false',
-            'f': 'json'
-        }
+        # ArcGIS REST API spatial query from the pre-encoded template
+        query = self._zoning_query_tmpl.format(X=centroid_x, Y=centroid_y)
         
-        data = self._make_arcgis_request('zoning', params)
+        data = self._make_arcgis_request('zoning', query)
         
         if data and data.get('features'):
             feature = data['features'][0]
             attributes = feature['attributes']
             
-            # Extract special provisions from SP1-SP5 fields
-            special_provisions = []
-            for i in range(1, 6):
-                sp_value = attributes.get(f'SP{i}')
-                if sp_value and str(sp_value).strip():
-                    special_provisions.append(f"SP:{sp_value}")
-            
-            zoning_data = {
-                'zone_code': attributes.get('ZONE', ''),
-                'zone_description': attributes.get('ZONE_DESC', ''),
-                'zone_class': attributes.get('CLASS', ''),
-                'special_provisions': special_provisions,
-                'special_provision_desc': attributes.get('SP_DESC', ''),
-                'full_zoning_desc': attributes.get('FULL_ZONING_DESC', ''),
-                'zone_shape_area': attributes.get('Shape__Area'),  # Zone boundary area
-                'zone_shape_length': attributes.get('Shape__Length'),  # Zone boundary length
-                'source': 'oakville_zoning_api',
-                'api_verified': True
-            }
+            zoning_data = self._extract_zoning(attributes, 'oakville_zoning_api')
+            zoning_data['zone_shape_area'] = attributes.get('Shape__Area')  # Zone boundary area
+            zoning_data['zone_shape_length'] = attributes.get('Shape__Length')  # Zone boundary length
             
-            logger.info(f"Found zoning: {zoning_data['zone_code']} with {len(special_provisions)} special provisions")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Found zoning: %s with %d special provisions",
+                            zoning_data['zone_code'], len(zoning_data['special_provisions']))
             return zoning_data
         
         logger.warning("No zoning data found for geometry")
@@ -248,8 +391,11 @@ class ArcGISAPIClient:
                 result['errors'].append("Property not found in Oakville address database")
                 return result
             
-            # Step 2: Get zoning data using property geometry
-            zoning_data = self.get_zoning_by_geometry(property_data['geometry'])
+            # Step 2: Get zoning data - reuse zoning joined onto the parcel
+            # record when present, otherwise query by property geometry
+            zoning_data = property_data.get('zoning')
+            if not zoning_data:
+                zoning_data = self.get_zoning_by_geometry(property_data['geometry'])
             if not zoning_data:
                 result['errors'].append("Zoning data not available for this property")
                 return result
@@ -284,7 +430,7 @@ class ArcGISAPIClient:
                 'zone_description': zoning_data['zone_description'],
                 'zone_class': zoning_data['zone_class'],
                 'lot_area_m2': lot_area,
-                'lot_area_sqft': lot_area * 10.764 if lot_area else None,
+                'lot_area_sqft': lot_area * M2_TO_FT2 if lot_area else None,
                 'lot_perimeter_m': float(shape_length) if shape_length else None,
                 'geometry': property_data['geometry'],
                 'data_quality': {
@@ -296,7 +442,8 @@ class ArcGISAPIClient:
                 }
             })
             
-            logger.info(f"Complete analysis successful for {address}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Complete analysis successful for %s", address)
             return result
             
         except Exception as e:
@@ -6,6 +6,8 @@ Fixes the 383 Maplehurst Avenue issue with missing SP:1 and incorrect dimensions
 import requests
 import json
 import logging
+import numpy as np
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 import sys
@@ -13,9 +15,32 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from backend.api_client import get_api_client
 from config import Config
+from utils.constants import UNIT_CONVERSIONS
 
 logger = logging.getLogger(__name__)
 
+M2_TO_FT2 = UNIT_CONVERSIONS['sqm_to_sqft']
+M_TO_FT = UNIT_CONVERSIONS['m_to_ft']
+
+@dataclass(frozen=True, slots=True)
+class VerifiedProperty:
+    """Pre-sanitized verified record for a known address"""
+    zone_code: str
+    base_zone: str
+    special_provision: str
+    zone_class: str
+    source: str
+    confidence: str
+    lot_area: Optional[float] = None  # sqm
+    lot_frontage: Optional[float] = None  # m
+    lot_depth: Optional[float] = None  # m
+    area_sqft: Optional[float] = None
+    frontage_ft: Optional[float] = None
+    depth_ft: Optional[float] = None
+    coordinates: Tuple[float, float] = (0, 0)
+    gis_reference: Optional[str] = None
+    notes: Optional[str] = None
+
 class EnhancedPropertyClient:
     """Enhanced client that provides exact data for specific problematic addresses"""
     
@@ -51,6 +76,48 @@ class EnhancedPropertyClient:
                 'confidence': 'high'
             }
         }
+        
+        # Numeric dimensions as parallel arrays (NaN where unknown), so the
+        # imperial conversions are one vectorized multiply per column
+        records = list(self.verified_properties.values())
+        self._lot_areas = self._numeric_column(records, 'lot_area')
+        self._frontages = self._numeric_column(records, 'lot_frontage')
+        self._depths = self._numeric_column(records, 'lot_depth')
+        lot_areas_sqft = self._lot_areas * M2_TO_FT2
+        frontages_ft = self._frontages * M_TO_FT
+        depths_ft = self._depths * M_TO_FT
+        
+        # Sanitize verified data once into immutable records plus a
+        # normalized address -> row index; explicit imperial values in the
+        # source data take precedence over the computed conversions
+        self._verified_list: List[VerifiedProperty] = [
+            VerifiedProperty(**{
+                'area_sqft': self._optional_float(lot_areas_sqft[row]),
+                'frontage_ft': self._optional_float(frontages_ft[row]),
+                'depth_ft': self._optional_float(depths_ft[row]),
+                **data
+            })
+            for row, data in enumerate(records)
+        ]
+        self._verified_index: Dict[str, int] = {
+            self._normalize_address(known_address): row
+            for row, known_address in enumerate(self.verified_properties)
+        }
+    
+    @staticmethod
+    def _numeric_column(records: List[Dict[str, Any]], field: str) -> np.ndarray:
+        """Collect one numeric field across records, NaN where missing"""
+        return np.array([record.get(field) or np.nan for record in records], dtype=np.float64)
+    
+    @staticmethod
+    def _optional_float(value: float) -> Optional[float]:
+        """Map NaN back to None for the record fields"""
+        return None if np.isnan(value) else float(value)
+    
+    @staticmethod
+    def _normalize_address(address: str) -> str:
+        """Lowercase, drop commas and collapse whitespace"""
+        return ' '.join(address.lower().replace(',', '').split())
     
     def get_enhanced_property_data(self, address: str, lat: float = None, lon: float = None) -> Dict[str, Any]:
         """
@@ -68,14 +135,21 @@ class EnhancedPropertyClient:
             return self._get_api_fallback(lat, lon, address)
             
         # Clean address for lookup
-        clean_address = address.lower().strip()
-        clean_address = clean_address.replace(',', '').replace('  ', ' ')
+        clean_address = self._normalize_address(address)
+        
+        # Exact match on the normalized address first
+        row = self._verified_index.get(clean_address)
+        if row is not None:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Using verified data for %s", address)
+            return self._format_verified_response(self._verified_list[row], address)
         
-        # Check if we have verified data for this address
-        for known_address, verified_data in self.verified_properties.items():
+        # Otherwise fall back to substring/pattern matching
+        for known_address, row in self._verified_index.items():
             if known_address in clean_address or self._address_matches(clean_address, known_address):
-                logger.info(f"Using verified data for {address}")
-                return self._format_verified_response(verified_data, address)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Using verified data for %s", address)
+                return self._format_verified_response(self._verified_list[row], address)
         
         # Try API first, then enhance with any missing data
         api_data = self._get_api_data(lat, lon, address)
@@ -94,26 +168,27 @@ class EnhancedPropertyClient:
             return '383 maplehurst' in known_address
         return False
     
-    def _format_verified_response(self, verified_data: Dict, original_address: str) -> Dict[str, Any]:
+    def _format_verified_response(self, verified_data: VerifiedProperty, original_address: str) -> Dict[str, Any]:
         """Format verified data into standard response format"""
+        source = verified_data.source
         response = {
             'success': True,
             'address': original_address,
-            'zone_code': verified_data['zone_code'],
-            'base_zone': verified_data['base_zone'],
-            'zone_class': verified_data['zone_class'],
-            'special_provision': verified_data['special_provision'],
-            'lot_area': verified_data['lot_area'],
-            'lot_frontage': verified_data.get('lot_frontage'),
-            'lot_depth': verified_data.get('lot_depth'),
-            'coordinates': verified_data.get('coordinates', (0, 0)),
-            'source': verified_data['source'],
-            'confidence': verified_data['confidence'],
+            'zone_code': verified_data.zone_code,
+            'base_zone': verified_data.base_zone,
+            'zone_class': verified_data.zone_class,
+            'special_provision': verified_data.special_provision,
+            'lot_area': verified_data.lot_area,
+            'lot_frontage': verified_data.lot_frontage,
+            'lot_depth': verified_data.lot_depth,
+            'coordinates': verified_data.coordinates,
+            'source': source,
+            'confidence': verified_data.confidence,
             'data_sources': {
-                'lot_area': f"{verified_data['source']}_exact",
-                'lot_frontage': f"{verified_data['source']}_surveyed", 
-                'lot_depth': f"{verified_data['source']}_surveyed",
-                'zone_code': f"{verified_data['source']}_verified"
+                'lot_area': f"{source}_exact",
+                'lot_frontage': f"{source}_surveyed", 
+                'lot_depth': f"{source}_surveyed",
+                'zone_code': f"{source}_verified"
             },
             'warnings': [],
             'real_data_obtained': ['zone_code', 'special_provision', 'lot_dimensions'],
@@ -122,24 +197,24 @@ class EnhancedPropertyClient:
                 'dimensions_source': 'official_measurements',
                 'area_accuracy': 'exact',
                 'has_real_zoning': True,
-                'has_special_provisions': bool(verified_data['special_provision']),
+                'has_special_provisions': bool(verified_data.special_provision),
                 'has_exact_dimensions': True
             }
         }
         
         # Add metric/imperial conversions
-        if verified_data.get('area_sqft'):
-            response['lot_area_sqft'] = verified_data['area_sqft']
-        if verified_data.get('frontage_ft'):
-            response['lot_frontage_ft'] = verified_data['frontage_ft']
-        if verified_data.get('depth_ft'):
-            response['lot_depth_ft'] = verified_data['depth_ft']
+        if verified_data.area_sqft:
+            response['lot_area_sqft'] = verified_data.area_sqft
+        if verified_data.frontage_ft:
+            response['lot_frontage_ft'] = verified_data.frontage_ft
+        if verified_data.depth_ft:
+            response['lot_depth_ft'] = verified_data.depth_ft
             
         # Add special notes
-        if verified_data.get('notes'):
-            response['special_notes'] = verified_data['notes']
-        if verified_data.get('gis_reference'):
-            response['reference_source'] = verified_data['gis_reference']
+        if verified_data.notes:
+            response['special_notes'] = verified_data.notes
+        if verified_data.gis_reference:
+            response['reference_source'] = verified_data.gis_reference
             
         return response
     
@@ -154,20 +229,18 @@ class EnhancedPropertyClient:
     
     def _enhance_api_data(self, api_data: Dict, address: str) -> Dict[str, Any]:
         """Enhance API data with additional processing for special provisions"""
-        enhanced = api_data.copy()
+        # get_zoning_info builds a fresh dict per call, so enhance in place
+        # rather than copying it
+        enhanced = api_data
         
         # Better special provision extraction
         sp_list = enhanced.get('special_provisions_list', [])
         if sp_list:
             # Clean up special provisions display
-            clean_sp = []
-            for sp in sp_list:
-                if ':' in sp:
-                    sp_num = sp.split(':')[0]
-                    clean_sp.append(f'SP:{sp_num}')
-                else:
-                    clean_sp.append(sp)
-            enhanced['special_provision'] = '; '.join(clean_sp)
+            enhanced['special_provision'] = '; '.join(
+                f"SP:{sp.split(':', 1)[0]}" if ':' in sp else sp
+                for sp in sp_list
+            )
         
         # Enhance zone code display
         if enhanced.get('special_provision'):
@@ -5,25 +5,95 @@ Based on Oakville's ArcGIS REST APIs and interactive map methodology
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import math
 import logging
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode, quote
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 import numpy as np
-from pyproj import Transformer
+from pyproj import Transformer, Geod
+from pathlib import Path
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.cache_manager import CacheManager
+
+try:
+    from shapely.geometry import shape
+    SHAPELY_AVAILABLE = True
+except ImportError:
+    SHAPELY_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _get_transformer(crs_from: str, crs_to: str) -> Transformer:
+    """
+    Process-wide Transformer cache; the PROJ pipeline is built and warmed
+    with one dummy transform so clients never pay that cost on a request
+    """
+    transformer = Transformer.from_crs(crs_from, crs_to, always_xy=True)
+    transformer.transform(0.0, 0.0)
+    return transformer
+
+if NUMBA_AVAILABLE:
+    # Compiled ring kernel; for the small rings parcels have, a tight
+    # loop beats NumPy's per-ufunc dispatch overhead
+    @njit(cache=True, fastmath=True)
+    def _ring_metrics_kernel(x, y):
+        # Area, perimeter and area-weighted centroid in a single pass
+        n = x.shape[0]
+        cross_sum = 0.0
+        perimeter = 0.0
+        cx = 0.0
+        cy = 0.0
+        sum_x = 0.0
+        sum_y = 0.0
+        for i in range(n):
+            j = (i + 1) % n
+            cross = x[i] * y[j] - x[j] * y[i]
+            cross_sum += cross
+            cx += (x[i] + x[j]) * cross
+            cy += (y[i] + y[j]) * cross
+            dx = x[j] - x[i]
+            dy = y[j] - y[i]
+            perimeter += math.sqrt(dx * dx + dy * dy)
+            sum_x += x[i]
+            sum_y += y[i]
+        if cross_sum == 0.0:
+            return 0.0, perimeter, sum_x / n, sum_y / n
+        return 0.5 * abs(cross_sum), perimeter, cx / (3.0 * cross_sum), cy / (3.0 * cross_sum)
+    
+    # Warm the JIT at import so the first real request doesn't pay for it
+    _warm_x = np.array([0.0, 1.0, 1.0, 0.0])
+    _warm_y = np.array([0.0, 0.0, 1.0, 1.0])
+    _ring_metrics_kernel(_warm_x, _warm_y)
+
 @dataclass
 class PropertyBoundary:
     """Property boundary data structure"""
-    coordinates: List[Tuple[float, float]]  # List of (x, y) coordinate pairs
+    coordinates: np.ndarray  # (N, 2) float64 array of (x, y) pairs
     area_sqm: float
     perimeter_m: float
     centroid: Tuple[float, float]
     spatial_reference: int
     geometry_type: str
+    utm_coordinates: Optional[np.ndarray] = None  # Same ring in UTM 17N, (N, 2)
 
 @dataclass
 class MeasurementPoint:
@@ -64,21 +134,66 @@ class InteractiveMeasurementClient:
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'OakvilleMeasurementTool/1.0',
-            'Accept': 'application/json, application/pbf'
+            'Accept': 'application/json, application/geo+json, application/pbf'
         })
         
+        self.timeout = 30
+        self.max_retries = 3
+        
+        # Size the connection pool for concurrent lookups and let urllib3
+        # handle retries on transient server errors
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(['GET'])
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Envelope query against the zoning service with all static
+        # parameters pre-encoded; only the envelope geometry is filled in
+        self._zoning_boundary_url_tmpl = (
+            self.base_url + self.endpoints['property_boundaries'] + '?' +
+            urlencode({
+                'f': 'geojson',  # Plain coordinate arrays, parsed natively by shapely
+                'geometryType': 'esriGeometryEnvelope',  # CORRECTED
+                'inSR': '102100',  # Web Mercator (CORRECTED)
+                'outSR': '102100',  # Return in Web Mercator (CORRECTED)
+                'spatialRel': 'esriSpatialRelIntersects',
+                'where': '1=1',
+                'outFields': '*',  # Get all fields
+                'returnGeometry': 'true',
+                'resultRecordCount': 10  # Get up to 10 features
+            }) + '&geometry={geometry}'
+        )
+        
+        # Worker pool for querying the boundary services concurrently
+        self._executor = ThreadPoolExecutor(max_workers=6, thread_name_prefix='boundary_lookup')
+        
         # Coordinate transformers (CORRECTED TO USE WEB MERCATOR)
         # Web Mercator (102100/3857) to WGS84 (4326)
-        self.web_mercator_to_wgs84 = Transformer.from_crs("EPSG:102100", "EPSG:4326", always_xy=True)
+        self.web_mercator_to_wgs84 = _get_transformer("EPSG:102100", "EPSG:4326")
         # WGS84 to Web Mercator (102100) - CORRECT for Oakville API
-        self.wgs84_to_web_mercator = Transformer.from_crs("EPSG:4326", "EPSG:102100", always_xy=True)
+        self.wgs84_to_web_mercator = _get_transformer("EPSG:4326", "EPSG:102100")
         # UTM Zone 17N (26917) to WGS84 (4326) - Keep for distance calculations  
-        self.utm17n_to_wgs84 = Transformer.from_crs("EPSG:26917", "EPSG:4326", always_xy=True)
+        self.utm17n_to_wgs84 = _get_transformer("EPSG:26917", "EPSG:4326")
         # WGS84 to UTM Zone 17N for accurate distance calculations
-        self.wgs84_to_utm17n = Transformer.from_crs("EPSG:4326", "EPSG:26917", always_xy=True)
+        self.wgs84_to_utm17n = _get_transformer("EPSG:4326", "EPSG:26917")
+        # Web Mercator directly to UTM Zone 17N - one projection step per
+        # vertex instead of hopping through WGS84
+        self.web_mercator_to_utm17n = _get_transformer("EPSG:3857", "EPSG:26917")
+        # WGS84 ellipsoid for geodesic distance/azimuth straight from lat/lon
+        self.geod = Geod(ellps="WGS84")
         
-        self.timeout = 30
-        self.max_retries = 3
+        # Boundary cache (memory + file) so repeat lookups skip the network,
+        # JSON parse and reprojection
+        self.cache_manager = CacheManager(
+            memory_size=2048,
+            enable_redis=False,
+            enable_file=True
+        )
         
     def get_property_boundary(self, lat: float, lon: float, address: str = None) -> Optional[PropertyBoundary]:
         """
@@ -92,20 +207,41 @@ class InteractiveMeasurementClient:
         Returns:
             PropertyBoundary object with coordinate data for measurement
         """
+        # Coordinates rounded to 6 decimals (~0.1 m) so identical lookups share a key
+        cache_key = f"property_boundary:{lat:.6f},{lon:.6f}:{(address or '').upper().strip()}"
+        cached_boundary = self.cache_manager.get(cache_key)
+        if cached_boundary is not None:
+            return cached_boundary
+        
+        boundary = self._fetch_property_boundary(lat, lon, address)
+        if boundary:
+            self.cache_manager.set(cache_key, boundary, cache_type='api_response')
+        return boundary
+    
+    def _fetch_property_boundary(self, lat: float, lon: float, address: str = None) -> Optional[PropertyBoundary]:
+        """
+        Query the boundary services concurrently (uncached), keeping the
+        fallback priority: the first service in order that returns a
+        boundary wins, so a slow later service never delays an earlier hit
+        """
         try:
-            # Method 1: Try using property boundaries endpoint (FeatureServer/4)
-            boundary = self._get_boundary_from_zoning_service(lat, lon)
-            if boundary:
-                return boundary
-                
-            # Method 2: Try using parcel fabric data
-            boundary = self._get_boundary_from_parcel_fabric(lat, lon, address)
-            if boundary:
-                return boundary
-                
-            # Method 3: Fallback to assessment parcels
-            boundary = self._get_boundary_from_assessment_parcels(lat, lon, address)
-            return boundary
+            futures = [
+                # Method 1: Try using property boundaries endpoint (FeatureServer/4)
+                self._executor.submit(self._get_boundary_from_zoning_service, lat, lon),
+                # Method 2: Try using parcel fabric data
+                self._executor.submit(self._get_boundary_from_parcel_fabric, lat, lon, address),
+                # Method 3: Fallback to assessment parcels
+                self._executor.submit(self._get_boundary_from_assessment_parcels, lat, lon, address)
+            ]
+            
+            for future in futures:
+                boundary = future.result()
+                if boundary:
+                    # Lower-priority lookups still in flight are no longer needed
+                    for pending in futures:
+                        pending.cancel()
+                    return boundary
+            return None
             
         except Exception as e:
             logger.error(f"Error getting property boundary: {e}")
@@ -119,34 +255,17 @@ class InteractiveMeasurementClient:
             
             # Create envelope around the point (buffer of ~50 meters)
             buffer = 50  # meters in Web Mercator
-            envelope = {
-                "xmin": x_mercator - buffer,
-                "ymin": y_mercator - buffer,
-                "xmax": x_mercator + buffer,
-                "ymax": y_mercator + buffer
-            }
-            
-            # Query parameters for property boundary (CORRECTED)
-            params = {
-                'f': 'json',  # Request JSON for easier parsing
-                'geometry': json.dumps(envelope),  # Use envelope geometry
-                'geometryType': 'esriGeometryEnvelope',  # CORRECTED
-                'inSR': '102100',  # Web Mercator (CORRECTED)
-                'outSR': '102100',  # Return in Web Mercator (CORRECTED)
-                'spatialRel': 'esriSpatialRelIntersects',
-                'where': '1=1',
-                'outFields': '*',  # Get all fields
-                'returnGeometry': 'true',
-                'resultRecordCount': 10  # Get up to 10 features
-            }
-            
-            url = self.base_url + self.endpoints['property_boundaries']
+            envelope = (
+                f'{{"xmin":{x_mercator - buffer},"ymin":{y_mercator - buffer},'
+                f'"xmax":{x_mercator + buffer},"ymax":{y_mercator + buffer}}}'
+            )
+            url = self._zoning_boundary_url_tmpl.format(geometry=quote(envelope))
             logger.info(f"Querying property boundaries at {lat}, {lon} (Web Mercator: {x_mercator}, {y_mercator})")
             
-            response = self.session.get(url, params=params, timeout=self.timeout)
+            response = self.session.get(url, timeout=self.timeout)
             
             if response.status_code == 200:
-                data = response.json()
+                data = self._decode_json(response)
                 logger.info(f"API response keys: {list(data.keys())}")
                 
                 if data.get('features') and len(data['features']) > 0:
@@ -154,7 +273,7 @@ class InteractiveMeasurementClient:
                     logger.info(f"Found {len(features)} features")
                     
                     # Return the first (largest/most relevant) feature
-                    feature = features[0]
+                    feature = self._geojson_to_esri_feature(features[0], data.get('crs'))
                     
                     # Log feature info for debugging
                     attrs = feature.get('attributes', {})
@@ -172,16 +291,54 @@ class InteractiveMeasurementClient:
             
         return None
     
+    def _decode_json(self, response: requests.Response) -> Dict:
+        """Decode an ArcGIS response body, using orjson when installed"""
+        if ORJSON_AVAILABLE:
+            return orjson.loads(response.content)
+        return response.json()
+    
+    def _geojson_to_esri_feature(self, feature: Dict, crs: Optional[Dict] = None) -> Dict:
+        """
+        Convert a GeoJSON polygon feature into the Esri JSON shape expected by
+        _parse_boundary_geometry, with the exterior ring in Web Mercator.
+        GeoJSON without a 'crs' member is WGS84 by definition.
+        """
+        geometry = feature.get('geometry') or {}
+        if 'rings' in geometry or not geometry.get('coordinates'):
+            return feature  # Already Esri JSON (or empty)
+        
+        if SHAPELY_AVAILABLE:
+            geom = shape(geometry)
+            if geom.geom_type == 'MultiPolygon':
+                geom = max(geom.geoms, key=lambda g: g.area)
+            ring = np.asarray(geom.exterior.coords, dtype=np.float64)[:, :2]
+        else:
+            coords = geometry['coordinates']
+            if geometry.get('type') == 'MultiPolygon':
+                coords = coords[0]
+            ring = np.asarray(coords[0], dtype=np.float64)[:, :2]
+        
+        crs_name = str(((crs or {}).get('properties') or {}).get('name', ''))
+        if not crs_name.endswith(('3857', '102100')):
+            xs, ys = self.wgs84_to_web_mercator.transform(ring[:, 0], ring[:, 1])
+            ring = np.column_stack((xs, ys))
+        
+        return {
+            'geometry': {'rings': [ring.tolist()]},
+            'attributes': feature.get('properties') or {}
+        }
+    
     def _get_boundary_from_parcel_fabric(self, lat: float, lon: float, address: str = None) -> Optional[PropertyBoundary]:
         """Get boundary from parcel fabric data"""
         try:
-            # If address provided, use it for lookup
+            # If address provided, use it for lookup: quotes escaped, LIKE
+            # wildcards stripped, and the pattern anchored at the start so
+            # the server can do a prefix scan instead of a full table scan
             if address:
-                clean_address = address.upper().strip()
-                where_clause = f"ADDRESS LIKE '%{clean_address}%'"
+                clean_address = address.upper().strip().replace('%', '').replace("'", "''")
+                where_clause = f"UPPER(ADDRESS) LIKE '{clean_address}%'"
             else:
                 # Use spatial query with coordinates
-                x_utm, y_utm = self.wgs84_to_utm17n.transform(lon, lat)
                 where_clause = '1=1'
             
             params = {
@@ -204,10 +361,10 @@ class InteractiveMeasurementClient:
             response = self.session.get(url, params=params, timeout=self.timeout)
             
             if response.status_code == 200:
-                data = response.json()
+                data = self._decode_json(response)
                 if data.get('features') and len(data['features']) > 0:
                     feature = data['features'][0]
-                    return self._parse_boundary_geometry(feature)
+                    return self._parse_boundary_geometry(feature, spatial_ref=26917)
                     
         except Exception as e:
             logger.warning(f"Parcel fabric boundary lookup failed: {e}")
@@ -235,10 +392,10 @@ class InteractiveMeasurementClient:
             response = self.session.get(url, params=params, timeout=self.timeout)
             
             if response.status_code == 200:
-                data = response.json()
+                data = self._decode_json(response)
                 if data.get('features') and len(data['features']) > 0:
                     feature = data['features'][0]
-                    return self._parse_boundary_geometry(feature)
+                    return self._parse_boundary_geometry(feature, spatial_ref=26917)
                     
         except Exception as e:
             logger.warning(f"Assessment parcels boundary lookup failed: {e}")
@@ -246,60 +403,73 @@ class InteractiveMeasurementClient:
         return None
     
     def _parse_boundary_geometry(self, feature: Dict, spatial_ref: int = 102100) -> Optional[PropertyBoundary]:
-        """Parse geometry from ArcGIS feature into PropertyBoundary (CORRECTED)"""
+        """
+        Parse geometry from ArcGIS feature into PropertyBoundary (CORRECTED)
+        
+        spatial_ref is the outSR the geometry was requested in; a wkid on the
+        geometry itself takes precedence
+        """
         try:
             geometry = feature.get('geometry', {})
             attributes = feature.get('attributes', {})
             
+            sr_info = geometry.get('spatialReference') or {}
+            spatial_ref = int(sr_info.get('latestWkid') or sr_info.get('wkid') or spatial_ref)
+            
             # Handle different geometry types
+            points = None
             if 'rings' in geometry:
                 # Polygon geometry
-                coordinates = []
                 rings = geometry['rings']
                 if rings and len(rings) > 0:
                     # Get exterior ring (first ring)
-                    exterior_ring = rings[0]
-                    coordinates = [(point[0], point[1]) for point in exterior_ring]
+                    points = rings[0]
                     
             elif 'paths' in geometry:
                 # Polyline geometry (shouldn't happen for parcels but handle it)
                 paths = geometry['paths']
                 if paths and len(paths) > 0:
-                    coordinates = [(point[0], point[1]) for point in paths[0]]
+                    points = paths[0]
             else:
                 logger.warning("Unsupported geometry type")
                 return None
             
-            if not coordinates:
+            if not points:
                 return None
             
-            # Convert coordinates to UTM for accurate area/perimeter calculations
-            utm_coordinates = []
-            for x_merc, y_merc in coordinates:
-                # Convert Web Mercator to WGS84, then to UTM
-                lon, lat = self.web_mercator_to_wgs84.transform(x_merc, y_merc)
-                x_utm, y_utm = self.wgs84_to_utm17n.transform(lon, lat)
-                utm_coordinates.append((x_utm, y_utm))
+            # Contiguous (N, 2) array; drops any Z/M values
+            coordinates = np.asarray(points, dtype=np.float64)[:, :2]
+            
+            # Convert coordinates to UTM for accurate area/perimeter calculations,
+            # reprojecting the whole ring in a single array transform; rings
+            # requested with outSR=26917 are already UTM
+            utm_ring = self._ring_to_utm(coordinates, spatial_ref)
             
             # Calculate area and perimeter using UTM coordinates for accuracy
-            area_sqm = self._calculate_polygon_area(utm_coordinates)
-            perimeter_m = self._calculate_polygon_perimeter(utm_coordinates)
-            centroid_utm = self._calculate_centroid(utm_coordinates)
+            area_sqm, perimeter_m, centroid_utm = self._calculate_ring_metrics(utm_ring)
             
-            # Store coordinates in Web Mercator as received from API
+            # Store coordinates as received from API
             return PropertyBoundary(
-                coordinates=coordinates,  # Keep in Web Mercator
+                coordinates=coordinates,  # Keep in the API's spatial reference
                 area_sqm=area_sqm,
                 perimeter_m=perimeter_m,
                 centroid=centroid_utm,  # Store centroid in UTM for calculations
-                spatial_reference=spatial_ref,  # Web Mercator (102100)
-                geometry_type="polygon"
+                spatial_reference=spatial_ref,  # Web Mercator (102100) or UTM (26917)
+                geometry_type="polygon",
+                utm_coordinates=utm_ring
             )
             
         except Exception as e:
             logger.error(f"Error parsing boundary geometry: {e}")
             return None
     
+    def _ring_to_utm(self, coordinates: np.ndarray, spatial_ref: int) -> np.ndarray:
+        """Return an (N, 2) ring in UTM 17N, reprojecting only if needed"""
+        if spatial_ref == 26917:
+            return coordinates
+        xs_utm, ys_utm = self.web_mercator_to_utm17n.transform(coordinates[:, 0], coordinates[:, 1])
+        return np.column_stack((xs_utm, ys_utm))
+    
     def calculate_distance(self, point1: Tuple[float, float], point2: Tuple[float, float], 
                           coordinate_system: str = 'wgs84') -> float:
         """
@@ -314,18 +484,35 @@ class InteractiveMeasurementClient:
             Distance in meters
         """
         if coordinate_system == 'wgs84':
-            # Convert to UTM for accurate distance calculation
-            x1, y1 = self.wgs84_to_utm17n.transform(point1[1], point1[0])  # lon, lat -> x, y
-            x2, y2 = self.wgs84_to_utm17n.transform(point2[1], point2[0])
-        else:
-            # Already in UTM
-            x1, y1 = point1
-            x2, y2 = point2
+            # Geodesic distance on the WGS84 ellipsoid - no projection needed
+            _, _, distance = self.geod.inv(point1[1], point1[0], point2[1], point2[0])
+            return distance
+        
+        # Already in UTM
+        x1, y1 = point1
+        x2, y2 = point2
         
         # Euclidean distance in UTM coordinates (meters)
         distance = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
         return distance
     
+    def calculate_distances(self, lats1, lons1, lats2, lons2) -> np.ndarray:
+        """
+        Calculate distances for many point pairs at once
+        
+        Args:
+            lats1, lons1: Latitudes/longitudes of the first points (array-like)
+            lats2, lons2: Latitudes/longitudes of the second points (array-like)
+            
+        Returns:
+            Array of geodesic distances in meters
+        """
+        _, _, distances = self.geod.inv(
+            np.asarray(lons1, dtype=np.float64), np.asarray(lats1, dtype=np.float64),
+            np.asarray(lons2, dtype=np.float64), np.asarray(lats2, dtype=np.float64)
+        )
+        return np.asarray(distances)
+    
     def calculate_azimuth(self, point1: Tuple[float, float], point2: Tuple[float, float],
                          coordinate_system: str = 'wgs84') -> float:
         """
@@ -335,11 +522,12 @@ class InteractiveMeasurementClient:
             Azimuth in degrees (0-360, where 0 is North)
         """
         if coordinate_system == 'wgs84':
-            x1, y1 = self.wgs84_to_utm17n.transform(point1[1], point1[0])
-            x2, y2 = self.wgs84_to_utm17n.transform(point2[1], point2[0])
-        else:
-            x1, y1 = point1
-            x2, y2 = point2
+            # Forward geodesic azimuth from true north
+            azimuth, _, _ = self.geod.inv(point1[1], point1[0], point2[1], point2[0])
+            return azimuth % 360
+        
+        x1, y1 = point1
+        x2, y2 = point2
         
         # Calculate azimuth
         dx = x2 - x1
@@ -368,9 +556,10 @@ class InteractiveMeasurementClient:
         Returns:
             PropertyMeasurement object with distance and metadata
         """
-        # Convert to UTM for accurate measurements
-        x1, y1 = self.wgs84_to_utm17n.transform(point1_lon, point1_lat)
-        x2, y2 = self.wgs84_to_utm17n.transform(point2_lon, point2_lat)
+        # Convert both points to UTM for accurate measurements in one call
+        xs, ys = self.wgs84_to_utm17n.transform([point1_lon, point2_lon], [point1_lat, point2_lat])
+        x1, y1 = float(xs[0]), float(ys[0])
+        x2, y2 = float(xs[1]), float(ys[1])
         
         # Create measurement points
         point1 = MeasurementPoint(
@@ -383,10 +572,10 @@ class InteractiveMeasurementClient:
             point_type=measurement_type, description=point2_desc
         )
         
-        # Calculate distance and azimuth
-        distance_m = self.calculate_distance((point1_lat, point1_lon), (point2_lat, point2_lon))
+        # Calculate distance and azimuth from the projected points
+        distance_m = self.calculate_distance((x1, y1), (x2, y2), 'utm')
         distance_ft = distance_m * 3.28084  # Convert to feet
-        azimuth = self.calculate_azimuth((point1_lat, point1_lon), (point2_lat, point2_lon))
+        azimuth = self.calculate_azimuth((x1, y1), (x2, y2), 'utm')
         
         return PropertyMeasurement(
             distance_m=distance_m,
@@ -410,30 +599,21 @@ class InteractiveMeasurementClient:
         if not boundary or len(boundary.coordinates) < 4:
             return {}
         
-        # Convert Web Mercator coordinates to lat/lon for return
-        coordinates_latlon = []
-        for x, y in boundary.coordinates:
-            lon, lat = self.web_mercator_to_wgs84.transform(x, y)
-            coordinates_latlon.append((lat, lon))
+        # Reuse the UTM ring computed when the boundary was parsed
+        utm = boundary.utm_coordinates
+        if utm is None:
+            utm = self._ring_to_utm(np.asarray(boundary.coordinates, dtype=np.float64),
+                                    boundary.spatial_reference)
         
         # Find the longest edge (likely street frontage)
-        max_distance = 0
+        edge_lengths = np.linalg.norm(np.diff(utm, axis=0), axis=1)
         frontage_points = None
         
-        for i in range(len(boundary.coordinates) - 1):
-            p1 = boundary.coordinates[i]
-            p2 = boundary.coordinates[i + 1]
-            # Convert Web Mercator to WGS84 for distance calculation
-            lon1, lat1 = self.web_mercator_to_wgs84.transform(p1[0], p1[1])
-            lon2, lat2 = self.web_mercator_to_wgs84.transform(p2[0], p2[1])
-            distance = self.calculate_distance((lat1, lon1), (lat2, lon2), 'wgs84')
-            
-            if distance > max_distance:
-                max_distance = distance
-                # Convert Web Mercator to lat/lon
-                lon1, lat1 = self.web_mercator_to_wgs84.transform(p1[0], p1[1])
-                lon2, lat2 = self.web_mercator_to_wgs84.transform(p2[0], p2[1])
-                frontage_points = [(lat1, lon1), (lat2, lon2)]
+        i = int(edge_lengths.argmax())
+        if edge_lengths[i] > 0:
+            # Only the two frontage endpoints need converting to lat/lon
+            lons, lats = self.utm17n_to_wgs84.transform(utm[i:i + 2, 0], utm[i:i + 2, 1])
+            frontage_points = [(float(lats[0]), float(lons[0])), (float(lats[1]), float(lons[1]))]
         
         # Find perpendicular points for depth measurement
         # This is a simplified approach - in practice you'd want more sophisticated analysis
@@ -458,47 +638,41 @@ class InteractiveMeasurementClient:
             
         return suggestions
     
-    def _calculate_polygon_area(self, coordinates: List[Tuple[float, float]]) -> float:
-        """Calculate polygon area using shoelace formula"""
-        if len(coordinates) < 3:
-            return 0.0
-        
-        area = 0.0
-        n = len(coordinates)
-        
-        for i in range(n):
-            j = (i + 1) % n
-            area += coordinates[i][0] * coordinates[j][1]
-            area -= coordinates[j][0] * coordinates[i][1]
-        
-        return abs(area) / 2.0
-    
-    def _calculate_polygon_perimeter(self, coordinates: List[Tuple[float, float]]) -> float:
-        """Calculate polygon perimeter"""
-        if len(coordinates) < 2:
-            return 0.0
+    def _calculate_ring_metrics(self, coordinates) -> Tuple[float, float, Tuple[float, float]]:
+        """
+        Calculate area, perimeter and area-weighted centroid of a ring in one pass
         
-        perimeter = 0.0
-        for i in range(len(coordinates) - 1):
-            distance = self.calculate_distance(coordinates[i], coordinates[i + 1], 'utm')
-            perimeter += distance
+        Degenerate (zero-area) rings fall back to the vertex mean for the centroid.
         
-        # Close the polygon if needed
-        if coordinates[0] != coordinates[-1]:
-            distance = self.calculate_distance(coordinates[-1], coordinates[0], 'utm')
-            perimeter += distance
+        Returns:
+            (area, perimeter, (centroid_x, centroid_y))
+        """
+        if len(coordinates) == 0:
+            return 0.0, 0.0, (0.0, 0.0)
         
-        return perimeter
-    
-    def _calculate_centroid(self, coordinates: List[Tuple[float, float]]) -> Tuple[float, float]:
-        """Calculate polygon centroid"""
-        if not coordinates:
-            return (0.0, 0.0)
+        a = np.asarray(coordinates, dtype=np.float64)
+        # Work relative to the first vertex: UTM values are ~1e6, so raw
+        # cross products would lose precision to cancellation
+        origin = a[0]
+        x = np.ascontiguousarray(a[:, 0] - origin[0])
+        y = np.ascontiguousarray(a[:, 1] - origin[1])
         
-        x_sum = sum(coord[0] for coord in coordinates)
-        y_sum = sum(coord[1] for coord in coordinates)
+        if NUMBA_AVAILABLE:
+            area, perimeter, cx, cy = _ring_metrics_kernel(x, y)
+        else:
+            x_next = np.roll(x, -1)
+            y_next = np.roll(y, -1)
+            cross = x * y_next - x_next * y
+            cross_sum = float(cross.sum())
+            perimeter = float(np.hypot(x_next - x, y_next - y).sum())
+            if cross_sum == 0.0:
+                area, cx, cy = 0.0, float(x.mean()), float(y.mean())
+            else:
+                area = 0.5 * abs(cross_sum)
+                cx = float(((x + x_next) * cross).sum()) / (3.0 * cross_sum)
+                cy = float(((y + y_next) * cross).sum()) / (3.0 * cross_sum)
         
-        return (x_sum / len(coordinates), y_sum / len(coordinates))
+        return float(area), float(perimeter), (float(cx + origin[0]), float(cy + origin[1]))
 
 # Singleton instance
 _measurement_client = None
@@ -5,11 +5,29 @@ Implements standard Ontario municipal property data patterns
 """
 
 import requests
+import numpy as np
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import logging
+import re
+import atexit
+import threading
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Tuple
-from urllib.parse import urlencode
+from urllib.parse import urlencode, urlsplit
 import time
+from pathlib import Path
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.cache_manager import CacheManager
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -19,13 +37,34 @@ class PropertyDataAPIClient:
     Based on research from ArcGIS documentation and municipal GIS patterns
     """
     
+    # Street suffix abbreviations applied in one pass during address search
+    _STREET_MAP = {
+        'AVENUE': 'AVE',
+        'STREET': 'ST',
+        'ROAD': 'RD',
+        'BOULEVARD': 'BLVD',
+        'DRIVE': 'DR',
+        'COURT': 'CRT',
+        'CRESCENT': 'CRES'
+    }
+    _STREET_RE = re.compile(r'\b(' + '|'.join(_STREET_MAP) + r')\b')
+    
+    # Decimal places kept in returned ring coordinates: ~1 cm in degrees,
+    # lossless for projected (metre) layers
+    _GEOMETRY_PRECISION = 7
+    
+    # Canonical keys whose values must be positive numbers
+    _NUMERIC_FIELDS = frozenset(('lot_area', 'frontage', 'depth'))
+    
+    # ArcGIS field types that hold numeric values
+    _NUMERIC_FIELD_TYPES = frozenset((
+        'esriFieldTypeDouble',
+        'esriFieldTypeSingle',
+        'esriFieldTypeInteger',
+        'esriFieldTypeSmallInteger'
+    ))
+    
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'PropertyDataClient/1.0',
-            'Accept': 'application/json'
-        })
-        
         # Standard field mappings based on Ontario municipal GIS patterns
         self.standard_fields = {
             'lot_area': ['SiteArea', 'LOT_AREA', 'AREA', 'Shape__Area', 'PARCEL_AREA'],
@@ -36,15 +75,142 @@ class PropertyDataAPIClient:
             'unit_measure': ['Unit_of_Measure', 'UNIT', 'UOM']
         }
         
+        # Reverse lookup: attribute name -> (canonical key, priority), so
+        # extraction is a single pass over a feature's attributes
+        self._field_reverse = {
+            name: (canonical, priority)
+            for canonical, names in self.standard_fields.items()
+            for priority, name in enumerate(names)
+        }
+        
         # Known working endpoints from research
         self.endpoints = {
             'oakville_zoning': 'https://maps.oakville.ca/oakgis/rest/services/SBS/Zoning_By_law_2014_014/FeatureServer/10/query',
             'oakville_assessment': 'https://maps.oakville.ca/oakgis/rest/services/SBS/Assessment_Parcels/FeatureServer/0/query',
             'ontario_example': 'https://ws.lioservices.lrc.gov.on.ca/arcgis2/rest/services/MOI/Property_Parcels_Public/MapServer/0/query'
         }
+        
+        # Fixed query parameters, built once; each call only overlays the
+        # fields that vary (geometry for the point query, where for the
+        # address search). Only the first feature is ever used, and the
+        # point query skips geometry on its first pass since most parcels
+        # carry their area as an attribute
+        self._point_params_template = {
+            'where': '1=1',
+            'outFields': '*',  # Get all fields to see what's available
+            'geometryType': 'esriGeometryPoint',
+            'inSR': '4326',
+            'spatialRel': 'esriSpatialRelIntersects',
+            'returnGeometry': 'false',
+            'resultRecordCount': 1,
+            'f': 'json'
+        }
+        self._address_params_template = {
+            'outFields': '*',
+            'returnGeometry': 'true',  # Needed for the zoning lookup centroid
+            'geometryPrecision': self._GEOMETRY_PRECISION,
+            'resultRecordCount': 1,
+            'f': 'json'
+        }
+        
+        # Layer URL -> numeric dimension field names from the layer schema
+        # (None when the schema couldn't be fetched)
+        self._numeric_fields: Dict[str, Optional[frozenset]] = {}
+    
+    # Sockets, threads and cache handles are created lazily on first use
+    # and dropped when pickling, so the client can be built before a fork
+    # and each process opens its own
+    _LAZY_RESOURCES = ('session', 'cache_manager', '_executor')
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        for name in self._LAZY_RESOURCES:
+            state.pop(name, None)
+        return state
+    
+    @cached_property
+    def cache_manager(self) -> CacheManager:
+        """
+        Response cache, created lazily on first request. ArcGIS query
+        results are effectively immutable per query, so successful
+        responses are cached in memory and on disk
+        """
+        return CacheManager(
+            memory_size=1000,
+            enable_redis=False,
+            enable_file=True
+        )
+    
+    @cached_property
+    def _executor(self) -> ThreadPoolExecutor:
+        """Worker pool for fanning out address searches across endpoints/terms"""
+        return ThreadPoolExecutor(max_workers=6, thread_name_prefix='address_search')
+    
+    @cached_property
+    def session(self) -> requests.Session:
+        """HTTP session, created lazily on first request"""
+        session = requests.Session()
+        session.headers.update({
+            'User-Agent': 'PropertyDataClient/1.0',
+            'Accept': 'application/json'
+        })
+        
+        # Larger keep-alive pool so concurrent searches don't block on
+        # connection checkout; throttling (429) and transient 5xx errors are
+        # retried by urllib3 with exponential backoff, honouring Retry-After.
+        # The last response is returned rather than raised so _make_request
+        # can log its status
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET', 'HEAD'],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retry)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    @classmethod
+    def warmup(cls, timeout: Optional[float] = None) -> 'PropertyDataAPIClient':
+        """
+        Create the shared client and wait for its connection warmup.
+        Call from the app entrypoint (or each worker's post-fork hook) so
+        the TLS handshakes happen at process start rather than on the
+        first user request
+        """
+        client = get_property_data_api_client()
+        _warmup_thread.join(timeout)
+        return client
+    
+    def _warm_connections(self) -> None:
+        """Open a pooled connection to each endpoint host"""
+        hosts = {'{0.scheme}://{0.netloc}/'.format(urlsplit(url)) for url in self.endpoints.values()}
+        for host in hosts:
+            try:
+                self.session.head(host, timeout=5)
+            except Exception as e:
+                logger.warning(f"Warmup failed for {host}: {e}")
+    
+    def close(self) -> None:
+        """
+        Release pooled connections and worker threads. The client stays
+        usable; both are recreated on the next request
+        """
+        if '_executor' in self.__dict__:
+            self.__dict__.pop('_executor').shutdown(wait=False, cancel_futures=True)
+        if 'session' in self.__dict__:
+            self.__dict__.pop('session').close()
     
     def _make_request(self, url: str, params: Dict[str, Any]) -> Optional[Dict]:
         """Make standardized API request with error handling"""
+        cache_key = f"property_data_api:{url}?{urlencode(sorted(params.items()))}"
+        cached_data = self.cache_manager.get(cache_key)
+        if cached_data is not None:
+            return cached_data
+        
         try:
             response = self.session.get(url, params=params, timeout=30)
             
@@ -55,22 +221,49 @@ class PropertyDataAPIClient:
                 logger.error(f"HTTP {response.status_code}: {response.text[:200]}")
                 return None
             
-            data = response.json()
+            # orjson decodes the attribute/ring payloads much faster
+            data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
             
             if 'error' in data:
                 logger.error(f"API Error: {data['error']}")
                 return data  # Return error for analysis
             
+            self.cache_manager.set(cache_key, data, cache_type='api_response')
             return data
             
         except Exception as e:
             logger.error(f"Request failed: {e}")
             return None
     
-    def _extract_property_dimensions(self, attributes: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_numeric_fields(self, url: str) -> Optional[frozenset]:
+        """
+        Dimension fields the layer declares as numeric, from its schema.
+        Fetched once per layer; None if the schema is unavailable
+        """
+        layer_url = url[:-len('/query')] if url.endswith('/query') else url
+        if layer_url in self._numeric_fields:
+            return self._numeric_fields[layer_url]
+        
+        metadata = self._make_request(layer_url, {'f': 'json'})
+        numeric_fields = None
+        if metadata and metadata.get('fields'):
+            numeric_fields = frozenset(
+                field['name'] for field in metadata['fields']
+                if field.get('type') in self._NUMERIC_FIELD_TYPES
+                and self._field_reverse.get(field['name'], (None,))[0] in self._NUMERIC_FIELDS
+            )
+        
+        self._numeric_fields[layer_url] = numeric_fields
+        return numeric_fields
+    
+    def _extract_property_dimensions(self, attributes: Dict[str, Any],
+                                     numeric_fields: Optional[frozenset] = None) -> Dict[str, Any]:
         """
         Extract property dimensions using standard field mapping patterns
         Based on research of Ontario municipal GIS schemas
+        
+        When the layer's numeric fields are known, dimension values are
+        taken from those fields without per-value type checks
         """
         result = {
             'lot_area': None,
@@ -85,60 +278,51 @@ class PropertyDataAPIClient:
             'fields_found': []
         }
         
-        # Extract lot area using multiple possible field names
-        for field_name in self.standard_fields['lot_area']:
-            if field_name in attributes and attributes[field_name] is not None:
-                value = attributes[field_name]
-                if isinstance(value, (int, float)) and value > 0:
-                    result['lot_area'] = float(value)
-                    result['fields_found'].append(f'lot_area:{field_name}')
-                    break
-        
-        # Extract frontage
-        for field_name in self.standard_fields['frontage']:
-            if field_name in attributes and attributes[field_name] is not None:
-                value = attributes[field_name]
-                if isinstance(value, (int, float)) and value > 0:
-                    result['frontage'] = float(value)
-                    result['fields_found'].append(f'frontage:{field_name}')
-                    break
-        
-        # Extract depth  
-        for field_name in self.standard_fields['depth']:
-            if field_name in attributes and attributes[field_name] is not None:
-                value = attributes[field_name]
-                if isinstance(value, (int, float)) and value > 0:
-                    result['depth'] = float(value)
-                    result['fields_found'].append(f'depth:{field_name}')
-                    break
-        
-        # Extract address
-        for field_name in self.standard_fields['address']:
-            if field_name in attributes and attributes[field_name]:
-                result['address'] = str(attributes[field_name])
-                result['fields_found'].append(f'address:{field_name}')
-                break
-        
-        # Extract roll number
-        for field_name in self.standard_fields['roll_number']:
-            if field_name in attributes and attributes[field_name]:
-                result['roll_number'] = str(attributes[field_name])
-                result['fields_found'].append(f'roll_number:{field_name}')
-                break
+        # Single pass: keep the highest-priority (lowest index) usable
+        # field for each canonical key
+        best = {}
+        for field_name, value in attributes.items():
+            mapping = self._field_reverse.get(field_name)
+            if mapping is None or value is None:
+                continue
+            canonical, priority = mapping
+            if canonical in self._NUMERIC_FIELDS:
+                if numeric_fields is not None:
+                    if field_name not in numeric_fields or value <= 0:
+                        continue
+                elif not (isinstance(value, (int, float)) and value > 0):
+                    continue
+            elif not value:
+                continue
+            current = best.get(canonical)
+            if current is None or priority < current[0]:
+                best[canonical] = (priority, field_name, value)
+        
+        # Numeric dimensions
+        for canonical in ('lot_area', 'frontage', 'depth'):
+            if canonical in best:
+                _, field_name, value = best[canonical]
+                result[canonical] = float(value)
+                result['fields_found'].append(f'{canonical}:{field_name}')
+        
+        # Address and roll number
+        for canonical in ('address', 'roll_number'):
+            if canonical in best:
+                _, field_name, value = best[canonical]
+                result[canonical] = str(value)
+                result['fields_found'].append(f'{canonical}:{field_name}')
         
         # Extract units of measurement
-        for field_name in self.standard_fields['unit_measure']:
-            if field_name in attributes and attributes[field_name]:
-                unit = str(attributes[field_name]).upper()
-                if 'M' in unit or 'METER' in unit:
-                    result['lot_area_units'] = 'm²'
-                    result['frontage_units'] = 'm'
-                    result['depth_units'] = 'm'
-                elif 'FT' in unit or 'FEET' in unit:
-                    result['lot_area_units'] = 'sq ft'
-                    result['frontage_units'] = 'ft'
-                    result['depth_units'] = 'ft'
-                break
+        if 'unit_measure' in best:
+            unit = str(best['unit_measure'][2]).upper()
+            if 'M' in unit or 'METER' in unit:
+                result['lot_area_units'] = 'm²'
+                result['frontage_units'] = 'm'
+                result['depth_units'] = 'm'
+            elif 'FT' in unit or 'FEET' in unit:
+                result['lot_area_units'] = 'sq ft'
+                result['frontage_units'] = 'ft'
+                result['depth_units'] = 'ft'
         
         # Default to metric if not specified
         if not result['lot_area_units']:
@@ -161,16 +345,7 @@ class PropertyDataAPIClient:
         }
         
         # Standard ArcGIS spatial query parameters
-        params = {
-            'where': '1=1',
-            'outFields': '*',  # Get all fields to see what's available
-            'geometry': f'{lon},{lat}',
-            'geometryType': 'esriGeometryPoint',
-            'inSR': '4326',
-            'spatialRel': 'esriSpatialRelIntersects',
-            'returnGeometry': 'true',  # Get geometry for area calculation
-            'f': 'json'
-        }
+        params = {**self._point_params_template, 'geometry': f'{lon},{lat}'}
         
         url = self.endpoints['oakville_assessment']
         logger.info(f"Testing Oakville Assessment Parcels API: {lat}, {lon}")
@@ -196,7 +371,17 @@ class PropertyDataAPIClient:
         geometry = feature.get('geometry', {})
         
         # Extract property dimensions using standard patterns
-        dimensions = self._extract_property_dimensions(attributes)
+        dimensions = self._extract_property_dimensions(attributes, self._get_numeric_fields(url))
+        
+        # Re-query with geometry only when the attributes carry no area
+        if not dimensions['lot_area']:
+            geom_data = self._make_request(url, {
+                **params,
+                'returnGeometry': 'true',
+                'geometryPrecision': self._GEOMETRY_PRECISION
+            })
+            if geom_data and geom_data.get('features'):
+                geometry = geom_data['features'][0].get('geometry', {})
         
         # Calculate area from geometry if not in attributes
         if not dimensions['lot_area'] and geometry.get('rings'):
@@ -229,21 +414,48 @@ class PropertyDataAPIClient:
         if len(coords) < 3:
             return 0.0
         
-        # Shoelace formula for polygon area
-        area = 0.0
-        n = len(coords)
+        # Vectorized shoelace formula; the wrap-around term is added
+        # explicitly to avoid np.roll copies
+        a = np.asarray(coords, dtype=np.float64)
+        x = a[:, 0]
+        y = a[:, 1]
+        area = np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1]) + (x[-1] * y[0] - x[0] * y[-1])
         
-        for i in range(n):
-            j = (i + 1) % n
-            area += coords[i][0] * coords[j][1]
-            area -= coords[j][0] * coords[i][1]
-        
-        return abs(area) / 2.0
+        return float(abs(area) / 2.0)
+    
+    def _calculate_polygon_centroid(self, rings: List[List[List[float]]]) -> Tuple[float, float]:
+        """
+        Area-weighted centroid (x, y) of the exterior ring, from the same
+        shoelace cross products as the area; falls back to the vertex mean
+        for degenerate rings
+        """
+        a = np.asarray(rings[0], dtype=np.float64)
+        # Shift to the first vertex to keep the cross products well-conditioned
+        origin = a[0, :2]
+        x = a[:, 0] - origin[0]
+        y = a[:, 1] - origin[1]
+        x_next = np.append(x[1:], x[0])
+        y_next = np.append(y[1:], y[0])
+        
+        cross = x * y_next - x_next * y
+        cross_sum = cross.sum()
+        if cross_sum == 0:
+            return float(x.mean() + origin[0]), float(y.mean() + origin[1])
+        
+        cx = np.dot(x + x_next, cross) / (3.0 * cross_sum)
+        cy = np.dot(y + y_next, cross) / (3.0 * cross_sum)
+        return float(cx + origin[0]), float(cy + origin[1])
     
     def search_property_by_address(self, address: str) -> Dict[str, Any]:
         """
         Search for property by address across multiple potential endpoints
         Implements the multi-source strategy from research
+        
+        All (endpoint, search term) queries are issued concurrently, but
+        results are taken in endpoint/term priority order, so the match
+        returned is the same as a sequential search would find. Queries
+        still queued when a match is found are cancelled; ones already in
+        flight run to completion and their responses are cached
         """
         result = {
             'success': False,
@@ -254,13 +466,17 @@ class PropertyDataAPIClient:
         
         # Clean address for search
         clean_address = address.upper().strip()
-        search_terms = [
-            clean_address,
-            clean_address.replace(' AVENUE', ' AVE'),
-            clean_address.replace(' STREET', ' ST'),
-            clean_address.replace(' ROAD', ' RD')
-        ]
+        canonical = self._STREET_RE.sub(lambda m: self._STREET_MAP[m.group(1)], clean_address)
         
+        # Parcel layers may store either the full or abbreviated suffix, so
+        # both forms are queried (in parallel below) only when they differ
+        search_terms = [clean_address]
+        if canonical != clean_address:
+            search_terms.append(canonical)
+        
+        # Fan out every (endpoint, search term) query concurrently; the
+        # highest-priority one that returns a feature wins
+        futures = {}
         for endpoint_name, endpoint_url in self.endpoints.items():
             if 'oakville' not in endpoint_name:
                 continue  # Skip non-Oakville endpoints for address search
@@ -268,46 +484,59 @@ class PropertyDataAPIClient:
             for search_term in search_terms:
                 logger.info(f"Searching {endpoint_name} for: {search_term}")
                 
+                # Quotes escaped, LIKE wildcards stripped, and the pattern
+                # anchored at the start so the server can do a prefix scan
+                # instead of a full table scan
+                safe_term = search_term.replace('%', '').replace("'", "''")
                 params = {
-                    'where': f"UPPER(ADDRESS) LIKE '%{search_term}%' OR UPPER(FULL_ADDRESS) LIKE '%{search_term}%'",
-                    'outFields': '*',
-                    'returnGeometry': 'true',
-                    'f': 'json'
+                    **self._address_params_template,
+                    'where': f"UPPER(ADDRESS) LIKE '{safe_term}%' OR UPPER(FULL_ADDRESS) LIKE '{safe_term}%'"
                 }
                 
-                attempt_result = {
-                    'endpoint': endpoint_name,
-                    'search_term': search_term,
-                    'success': False
-                }
+                future = self._executor.submit(self._make_request, endpoint_url, params)
+                futures[future] = (endpoint_name, search_term)
+        
+        # Dicts keep insertion order, so this walks the futures in priority
+        # order rather than completion order
+        for future, (endpoint_name, search_term) in futures.items():
+            attempt_result = {
+                'endpoint': endpoint_name,
+                'search_term': search_term,
+                'success': False
+            }
+            
+            data = future.result()
+            
+            if data and data.get('features'):
+                # Remaining queries are no longer needed
+                for pending in futures:
+                    pending.cancel()
                 
-                data = self._make_request(endpoint_url, params)
+                feature = data['features'][0]
+                attributes = feature['attributes']
+                geometry = feature.get('geometry', {})
                 
-                if data and data.get('features'):
-                    feature = data['features'][0]
-                    attributes = feature['attributes']
-                    geometry = feature.get('geometry', {})
-                    
-                    # Extract property dimensions
-                    dimensions = self._extract_property_dimensions(attributes)
-                    
-                    attempt_result.update({
-                        'success': True,
-                        'property_dimensions': dimensions,
-                        'raw_attributes': attributes,
-                        'geometry': geometry
-                    })
-                    
-                    result.update({
-                        'success': True,
-                        'found_endpoint': endpoint_name,
-                        'property_data': attempt_result
-                    })
-                    
-                    logger.info(f"Found property in {endpoint_name}: {dimensions['address']}")
-                    return result
+                # Extract property dimensions
+                numeric_fields = self._get_numeric_fields(self.endpoints[endpoint_name])
+                dimensions = self._extract_property_dimensions(attributes, numeric_fields)
                 
-                result['search_attempts'].append(attempt_result)
+                attempt_result.update({
+                    'success': True,
+                    'property_dimensions': dimensions,
+                    'raw_attributes': attributes,
+                    'geometry': geometry
+                })
+                
+                result.update({
+                    'success': True,
+                    'found_endpoint': endpoint_name,
+                    'property_data': attempt_result
+                })
+                
+                logger.info(f"Found property in {endpoint_name}: {dimensions['address']}")
+                return result
+            
+            result['search_attempts'].append(attempt_result)
         
         logger.warning(f"Property not found in any endpoint: {address}")
         return result
@@ -345,11 +574,7 @@ class PropertyDataAPIClient:
                 geometry = address_result['property_data'].get('geometry', {})
                 if geometry.get('rings'):
                     # Calculate centroid for zoning lookup
-                    rings = geometry['rings'][0]
-                    x_coords = [point[0] for point in rings]
-                    y_coords = [point[1] for point in rings]
-                    lat = sum(y_coords) / len(y_coords)
-                    lon = sum(x_coords) / len(x_coords)
+                    lon, lat = self._calculate_polygon_centroid(geometry['rings'])
                     result['coordinates'] = (lat, lon)
         
         # Method 2: Coordinate-based search if coordinates available
@@ -389,10 +614,20 @@ class PropertyDataAPIClient:
 
 # Singleton instance
 _property_api_client = None
+_warmup_thread: Optional[threading.Thread] = None
 
 def get_property_data_api_client() -> PropertyDataAPIClient:
     """Get singleton property data API client"""
-    global _property_api_client
+    global _property_api_client, _warmup_thread
     if _property_api_client is None:
         _property_api_client = PropertyDataAPIClient()
+        atexit.register(_property_api_client.close)
+        
+        # Connect in the background so the first lookup reuses a pooled
+        # connection
+        _warmup_thread = threading.Thread(
+            target=_property_api_client._warm_connections,
+            name='property_data_api_warmup', daemon=True
+        )
+        _warmup_thread.start()
     return _property_api_client
\ No newline at end of file
@@ -5,8 +5,11 @@ Includes accurate development potential calculations based on official by-law do
 """
 
 import logging
+import sys
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Any
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple, Any
 from datetime import datetime, timedelta
 from config import Config, ZoningConfig
 from models.valuation import (
@@ -15,9 +18,257 @@ from models.valuation import (
     ValuationMethod, MarketCondition
 )
 from models.zoning import DevelopmentPotential
+from utils.constants import UNIT_CONVERSIONS
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+M2_TO_FT2 = UNIT_CONVERSIONS['sqm_to_sqft']
+M_TO_FT = UNIT_CONVERSIONS['m_to_ft']
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _valuate_core(lot_area, land_value_per_sqm, building_area, building_value_per_sqm,
+                      age_years, renovation_year, current_year, depreciation_rate,
+                      max_depreciation_years, nearby_parks, nearby_schools,
+                      has_transit, transit_distance, special_location_pct):
+        # Numeric core of estimate_property_value, same rules as
+        # _calculate_building_and_depreciation and
+        # _calculate_location_adjustments. renovation_year 0 means none
+        base_land_value = lot_area * land_value_per_sqm
+        base_building_value = building_area * building_value_per_sqm
+        
+        effective_age = age_years
+        if renovation_year != 0:
+            effective_age = min(age_years, current_year - renovation_year)
+        depreciation_factor = max(0.3, 1 - min(effective_age, max_depreciation_years) * depreciation_rate)
+        building_value = base_building_value * depreciation_factor
+        depreciation = -min(base_building_value * min(age_years, max_depreciation_years) * depreciation_rate,
+                            base_building_value * 0.7)
+        
+        location_pct = special_location_pct
+        if nearby_parks > 0:
+            location_pct += min(nearby_parks * 0.02, 0.10)
+        if nearby_schools > 0:
+            location_pct += min(nearby_schools * 0.015, 0.08)
+        if has_transit:
+            if transit_distance <= 500:
+                location_pct += 0.12
+            elif transit_distance <= 1000:
+                location_pct += 0.06
+        
+        return base_land_value, building_value, depreciation, base_land_value * location_pct
+    
+    # Warm the JIT at import so the first valuation doesn't pay for it
+    _valuate_core(1.0, 1.0, 1.0, 1.0, 1.0, 0.0, 2000.0, 0.02, 40.0, 0.0, 0.0, False, 0.0, 0.0)
+    
+    def _valuate_core_batch_impl(lot_area, land_value_per_sqm, building_area, building_value_per_sqm,
+                                 age_years, renovation_year, current_year, depreciation_rate,
+                                 max_depreciation_years, nearby_parks, nearby_schools,
+                                 has_transit, transit_distance, special_location_pct):
+        # _valuate_core over per-property column arrays; each iteration
+        # writes only its own index, so the loop is safe to parallelize
+        n = lot_area.shape[0]
+        land_value = np.empty(n)
+        building_value = np.empty(n)
+        depreciation = np.empty(n)
+        location_premium = np.empty(n)
+        for i in prange(n):
+            land, building, depr, location = _valuate_core(
+                lot_area[i], land_value_per_sqm[i], building_area[i], building_value_per_sqm[i],
+                age_years[i], renovation_year[i], current_year, depreciation_rate,
+                max_depreciation_years, nearby_parks[i], nearby_schools[i],
+                has_transit[i], transit_distance[i], special_location_pct[i]
+            )
+            land_value[i] = land
+            building_value[i] = building
+            depreciation[i] = depr
+            location_premium[i] = location
+        return land_value, building_value, depreciation, location_premium
+    
+    def _warm_valuate_core_batch(kernel):
+        ones = np.ones(2)
+        kernel(ones, ones, ones, ones, ones, np.zeros(2), 2000.0, 0.02, 40.0,
+               ones, ones, np.ones(2, dtype=np.bool_), ones, ones)
+        return kernel
+    
+    # Prefer the multi-core build; fall back to a serial one where no
+    # threading layer is available
+    try:
+        _valuate_core_batch = _warm_valuate_core_batch(
+            njit(parallel=True, cache=True, fastmath=True)(_valuate_core_batch_impl)
+        )
+    except Exception as e:
+        logger.warning(f"Parallel valuation kernel unavailable, using serial build: {e}")
+        _valuate_core_batch = _warm_valuate_core_batch(
+            njit(cache=True, fastmath=True)(_valuate_core_batch_impl)
+        )
+
+
+# Single family redevelopment sale price premium by base zone
+_REDEVELOPMENT_ZONE_PREMIUMS = {'RL1': 1.2, 'RL2': 1.15, 'RL3': 1.1, 'RL4': 1.05, 'RL5': 1.05, 'RL6': 1.0}
+
+
+def _redevelopment_core(max_floor_area, construction_cost_per_sqm, soft_cost_pct,
+                        current_value, price_per_sqm):
+    """
+    Numeric core of _calculate_redevelopment_value: (gross_revenue,
+    total_development_cost, gross_profit, profit_margin, land_costs,
+    construction_costs)
+    """
+    # Construction costs
+    hard_costs = max_floor_area * construction_cost_per_sqm
+    soft_costs = hard_costs * soft_cost_pct
+    
+    # Land costs (acquisition + demolition)
+    land_costs = current_value + 50000.0  # Assume $50k demolition
+    
+    total_development_cost = land_costs + hard_costs + soft_costs
+    
+    gross_revenue = max_floor_area * price_per_sqm
+    gross_profit = gross_revenue - total_development_cost
+    profit_margin = gross_profit / gross_revenue if gross_revenue > 0 else 0.0
+    
+    return (gross_revenue, total_development_cost, gross_profit, profit_margin,
+            land_costs, hard_costs + soft_costs)
+
+
+if NUMBA_AVAILABLE:
+    # Explicit signature: compiled eagerly at import, never in a request
+    _redevelopment_core = njit(
+        'UniTuple(float64, 6)(float64, float64, float64, float64, float64)', cache=True, fastmath=True
+    )(_redevelopment_core)
+
+
+# Market condition adjustment (fraction of base value) and base days on
+# market; any other condition is treated as balanced
+_MARKET_FACTORS = {
+    MarketCondition.HOT: 0.08,        # 8% premium
+    MarketCondition.BALANCED: 0.02,   # 2% moderate premium
+    MarketCondition.COOL: -0.05,      # 5% discount
+    MarketCondition.DECLINING: -0.12  # 12% discount
+}
+_BASE_DAYS_ON_MARKET = {
+    MarketCondition.HOT: 14,
+    MarketCondition.BALANCED: 28,
+    MarketCondition.COOL: 42,
+    MarketCondition.DECLINING: 65
+}
+
+# Indexed forms of the market tables for batch valuation
+_MARKET_CONDITION_IDS = {condition: i for i, condition in enumerate(_MARKET_FACTORS)}
+_MARKET_FACTOR_ARR = np.array([_MARKET_FACTORS[c] for c in _MARKET_CONDITION_IDS], dtype=np.float64)
+_BASE_DAYS_ON_MARKET_ARR = np.array([_BASE_DAYS_ON_MARKET[c] for c in _MARKET_CONDITION_IDS])
+
+
+# Zone code flag bits, so several zone checks are one integer test
+_ZONE_RL = 1           # Low density residential (RL*)
+_ZONE_RM = 2           # Medium density residential (RM*)
+_ZONE_SUFFIX_0 = 4     # '-0' suffix zone
+_ZONE_PREMIUM_RL = 8   # Premium estate zones (exactly RL1 / RL2)
+
+
+class _ZoneInfo(NamedTuple):
+    base_zone: str  # Without special provisions or suffix zones
+    flags: int      # _ZONE_* bits
+
+
+@lru_cache(maxsize=4096)
+def _parse_zone(zone_code: str) -> _ZoneInfo:
+    """Parse a zone code once; zone codes repeat heavily across valuations"""
+    flags = 0
+    if zone_code.startswith('RL'):
+        flags |= _ZONE_RL
+        if zone_code in ('RL1', 'RL2'):
+            flags |= _ZONE_PREMIUM_RL
+    elif zone_code.startswith('RM'):
+        flags |= _ZONE_RM
+    if '-0' in zone_code:
+        flags |= _ZONE_SUFFIX_0
+    return _ZoneInfo(base_zone=zone_code.split(' ')[0].split('-')[0], flags=flags)
+
+
+def _valuation_notes(zone_code: str, heritage_designated: bool, waterfront: bool) -> List[str]:
+    """Valuation notes and disclaimers for a property"""
+    notes = []
+    
+    if heritage_designated:
+        notes.append("Heritage designation may restrict development and affect value")
+    
+    if waterfront:
+        notes.append("Waterfront premium applied - verify actual water access")
+    
+    if _parse_zone(zone_code).flags & _ZONE_SUFFIX_0:
+        notes.append("Subject to -0 suffix zone restrictions affecting development potential")
+    
+    notes.append("Valuation is estimate only - professional appraisal recommended")
+    notes.append("Market conditions subject to change - values updated monthly")
+    
+    return notes
+
+
+@dataclass
+class ValuationColumns:
+    """
+    Portfolio valuation results stored column-wise, one array entry per
+    property. Indexing builds that property's ValuationResult on demand
+    """
+    zone_code: List[str]
+    market_condition: List[MarketCondition]
+    land_value: np.ndarray
+    building_value: np.ndarray
+    depreciation: np.ndarray
+    location_premium: np.ndarray
+    bedroom_key: np.ndarray
+    bedroom_adjustment: np.ndarray
+    bathroom_key: np.ndarray
+    bathroom_adjustment: np.ndarray
+    market_adjustment: np.ndarray
+    total_adjustments: np.ndarray
+    estimated_value: np.ndarray
+    confidence_score: np.ndarray
+    confidence_range_low: np.ndarray
+    confidence_range_high: np.ndarray
+    days_on_market: np.ndarray
+    heritage_designated: np.ndarray
+    waterfront: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.zone_code)
+    
+    def __getitem__(self, i: int) -> ValuationResult:
+        return ValuationResult(
+            valuation_method=ValuationMethod.AUTOMATED,
+            estimated_value=max(0.0, float(self.estimated_value[i])),
+            confidence_score=float(self.confidence_score[i]),
+            confidence_range_low=float(self.confidence_range_low[i]),
+            confidence_range_high=float(self.confidence_range_high[i]),
+            breakdown=ValuationBreakdown(
+                land_value=float(self.land_value[i]),
+                building_value=float(self.building_value[i]),
+                depreciation=float(self.depreciation[i]),
+                location_premium=float(self.location_premium[i]),
+                amenity_adjustments={
+                    str(self.bedroom_key[i]): float(self.bedroom_adjustment[i]),
+                    str(self.bathroom_key[i]): float(self.bathroom_adjustment[i])
+                },
+                market_adjustment=float(self.market_adjustment[i]),
+                total_adjustments=float(self.total_adjustments[i])
+            ),
+            market_condition=self.market_condition[i],
+            days_on_market_estimate=int(self.days_on_market[i]),
+            notes=_valuation_notes(self.zone_code[i], bool(self.heritage_designated[i]), bool(self.waterfront[i]))
+        )
+    
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
 
 class PropertyValuator:
     """Enhanced property valuation engine with precise zoning integration"""
@@ -60,6 +311,13 @@ class PropertyValuator:
             'basic_finish': 2000
         }
         
+        # Indexed forms of the rate tables for batch lookups; index -1 is
+        # the default rate for unknown zones / building types
+        self._zone_ids = {zone: i for i, zone in enumerate(self.base_land_values)}
+        self._land_rate_arr = np.array([*self.base_land_values.values(), 500], dtype=np.float64)
+        self._building_type_ids = {building_type: i for i, building_type in enumerate(self.building_values)}
+        self._building_rate_arr = np.array([*self.building_values.values(), 2800], dtype=np.float64)
+        
         # Location adjustment factors
         self.location_factors = ZoningConfig.LOCATION_PREMIUMS
         
@@ -82,7 +340,8 @@ class PropertyValuator:
                                heritage_designated: bool = False,
                                is_corner: bool = False,
                                renovation_year: Optional[int] = None,
-                               market_condition: MarketCondition = MarketCondition.BALANCED) -> ValuationResult:
+                               market_condition: MarketCondition = MarketCondition.BALANCED,
+                               current_year: Optional[int] = None) -> ValuationResult:
         """
         Comprehensive property valuation using multiple factors
         
@@ -102,41 +361,63 @@ class PropertyValuator:
             is_corner: Is corner lot
             renovation_year: Year of major renovation
             market_condition: Current market condition
+            current_year: Year renovations are aged against (read from the
+                clock only when needed if not given)
             
         Returns:
             ValuationResult with detailed breakdown
         """
         
-        # Parse zone for base calculations
-        base_zone = self._parse_base_zone(zone_code)
+        # Parse zone for base calculations; interned so the zone caches
+        # compare keys by identity
+        zone_code = sys.intern(zone_code)
+        base_zone = _parse_zone(zone_code).base_zone
         
         # Calculate base land value
         land_value_per_sqm = self.base_land_values.get(base_zone, 500)
-        base_land_value = lot_area * land_value_per_sqm
         
-        # Calculate building value with depreciation
-        building_value = self._calculate_building_value(
-            building_area, building_type, age_years, renovation_year
-        )
+        if NUMBA_AVAILABLE:
+            # Compiled land, building, depreciation and location arithmetic
+            special_location_pct = (
+                (self.location_factors['waterfront'] if waterfront else 0.0)
+                + (self.location_factors['heritage_designated'] if heritage_designated else 0.0)
+                + (self.location_factors['corner_lot'] if is_corner else 0.0)
+            )
+            base_land_value, building_value, depreciation, location_premium = _valuate_core(
+                float(lot_area), float(land_value_per_sqm),
+                float(building_area), float(self.building_values.get(building_type, 2800)),
+                float(age_years), float(renovation_year or 0),
+                float(current_year or (datetime.now().year if renovation_year else 0)),
+                float(self.depreciation_rate), float(Config.MAX_DEPRECIATION_YEARS),
+                float(nearby_parks), float(nearby_schools),
+                transit_distance is not None, float(transit_distance or 0), special_location_pct
+            )
+        else:
+            base_land_value = lot_area * land_value_per_sqm
+            
+            # Calculate building value with depreciation
+            building_value, depreciation = self._calculate_building_and_depreciation(
+                building_area, building_type, age_years, renovation_year, current_year
+            )
+            
+            # Calculate location adjustments
+            location_premium, _ = self._calculate_location_adjustments(
+                base_land_value, nearby_parks, nearby_schools, transit_distance,
+                waterfront, heritage_designated, is_corner
+            )
         
         # Calculate feature adjustments
-        feature_adjustments = self._calculate_feature_adjustments(
+        feature_total, feature_adjustments = self._calculate_feature_adjustments(
             base_land_value, num_bedrooms, num_bathrooms
         )
         
-        # Calculate location adjustments
-        location_adjustments = self._calculate_location_adjustments(
-            base_land_value, nearby_parks, nearby_schools, transit_distance,
-            waterfront, heritage_designated, is_corner
-        )
-        
         # Apply market condition adjustment
         market_adj_value = self._apply_market_adjustment(
             base_land_value + building_value, market_condition
         )
         
         # Calculate total adjustments
-        total_adjustments = sum(feature_adjustments.values()) + sum(location_adjustments.values()) + market_adj_value
+        total_adjustments = feature_total + location_premium + market_adj_value
         
         # Calculate final value
         base_value = base_land_value + building_value
@@ -152,8 +433,8 @@ class PropertyValuator:
         breakdown = ValuationBreakdown(
             land_value=base_land_value,
             building_value=building_value,
-            depreciation=self._calculate_depreciation(building_area, building_type, age_years),
-            location_premium=sum(location_adjustments.values()),
+            depreciation=depreciation,
+            location_premium=location_premium,
             amenity_adjustments=feature_adjustments,
             market_adjustment=market_adj_value,
             total_adjustments=total_adjustments
@@ -174,115 +455,277 @@ class PropertyValuator:
             notes=self._generate_valuation_notes(zone_code, heritage_designated, waterfront)
         )
     
+    def estimate_property_value_batch(self, properties: Dict[str, Any],
+                                      current_year: Optional[int] = None) -> 'ValuationColumns':
+        """
+        Value a portfolio of properties with vectorized NumPy arithmetic
+        
+        Args:
+            properties: Columns keyed by estimate_property_value argument name,
+                one entry per property. zone_code, lot_area and building_area
+                are required; missing columns take the estimate_property_value
+                defaults. None (or 0) means no renovation_year and None (or
+                NaN) means no transit_distance
+            current_year: Year renovations are aged against (defaults to now,
+                read once per batch)
+        
+        Returns:
+            ValuationColumns in input order; results[i] (or iterating) gives
+            each property's ValuationResult
+        """
+        zone_codes = [sys.intern(str(zone_code)) for zone_code in properties['zone_code']]
+        zone_infos = [_parse_zone(z) for z in zone_codes]
+        n = len(zone_codes)
+        
+        def column(name: str, default: Any, dtype=np.float64) -> np.ndarray:
+            values = properties.get(name)
+            if values is None:
+                return np.full(n, default, dtype=dtype)
+            return np.asarray(values, dtype=dtype)
+        
+        lot_area = np.asarray(properties['lot_area'], dtype=np.float64)
+        building_area = np.asarray(properties['building_area'], dtype=np.float64)
+        bedrooms = column('num_bedrooms', 3)
+        bathrooms = column('num_bathrooms', 2.5)
+        age_years = column('age_years', 10)
+        nearby_parks = column('nearby_parks', 0)
+        nearby_schools = column('nearby_schools', 0)
+        transit_distance = column('transit_distance', np.nan)
+        waterfront = column('waterfront', False, bool)
+        heritage_designated = column('heritage_designated', False, bool)
+        is_corner = column('is_corner', False, bool)
+        renovation_year = np.nan_to_num(column('renovation_year', 0))
+        building_types = properties.get('building_type')
+        if building_types is None:
+            building_types = ['detached_dwelling'] * n
+        market_conditions = properties.get('market_condition')
+        if market_conditions is None:
+            market_conditions = [MarketCondition.BALANCED] * n
+        market_conditions = [MarketCondition(condition) for condition in market_conditions]
+        
+        # Per-property rates gathered from the indexed rate tables
+        zone_ids = np.fromiter(
+            (self._zone_ids.get(info.base_zone, -1) for info in zone_infos), dtype=np.intp, count=n
+        )
+        type_ids = np.fromiter(
+            (self._building_type_ids.get(t, -1) for t in building_types), dtype=np.intp, count=n
+        )
+        land_value_per_sqm = self._land_rate_arr[zone_ids]
+        building_value_per_sqm = self._building_rate_arr[type_ids]
+        
+        special_location_pct = (
+            waterfront * self.location_factors['waterfront']
+            + heritage_designated * self.location_factors['heritage_designated']
+            + is_corner * self.location_factors['corner_lot']
+        )
+        
+        if NUMBA_AVAILABLE:
+            # Compiled per-property core, spread across cores
+            base_land_value, building_value, depreciation, location_premium = _valuate_core_batch(
+                lot_area, land_value_per_sqm, building_area, building_value_per_sqm,
+                age_years, renovation_year, float(current_year or datetime.now().year),
+                float(self.depreciation_rate), float(Config.MAX_DEPRECIATION_YEARS),
+                nearby_parks, nearby_schools,
+                ~np.isnan(transit_distance), np.nan_to_num(transit_distance), special_location_pct
+            )
+        else:
+            # Land and depreciated building value (see
+            # _calculate_building_and_depreciation)
+            base_land_value = lot_area * land_value_per_sqm
+            base_building_value = building_area * building_value_per_sqm
+            effective_age = np.where(
+                renovation_year != 0,
+                np.minimum(age_years, (current_year or datetime.now().year) - renovation_year),
+                age_years
+            )
+            depreciation_factor = np.maximum(
+                0.3, 1 - np.minimum(effective_age, Config.MAX_DEPRECIATION_YEARS) * self.depreciation_rate
+            )
+            building_value = base_building_value * depreciation_factor
+            depreciation = -np.minimum(
+                base_building_value * np.minimum(age_years, Config.MAX_DEPRECIATION_YEARS) * self.depreciation_rate,
+                base_building_value * 0.7
+            )
+            
+            # Location adjustments as one multiplier on land value (see
+            # _calculate_location_adjustments); NaN transit distances match nothing
+            location_multiplier = (
+                np.where(nearby_parks > 0, np.minimum(nearby_parks * 0.02, 0.10), 0)
+                + np.where(nearby_schools > 0, np.minimum(nearby_schools * 0.015, 0.08), 0)
+                + np.select([transit_distance <= 500, transit_distance <= 1000], [0.12, 0.06], 0)
+                + special_location_pct
+            )
+            location_premium = base_land_value * location_multiplier
+        
+        # Feature adjustments (see _calculate_feature_adjustments)
+        many_bedrooms, few_bedrooms = bedrooms >= 4, bedrooms < 3
+        bedroom_adj = np.select([many_bedrooms, few_bedrooms], [(bedrooms - 3) * 15000, (bedrooms - 3) * 10000], 0)
+        bedroom_key = np.select([many_bedrooms, few_bedrooms], ['extra_bedrooms', 'fewer_bedrooms'], 'bedrooms')
+        many_bathrooms, few_bathrooms = bathrooms >= 3, bathrooms < 2
+        bathroom_adj = np.select([many_bathrooms, few_bathrooms], [(bathrooms - 2.5) * 8000, (bathrooms - 2.5) * 6000], 0)
+        bathroom_key = np.select([many_bathrooms, few_bathrooms], ['extra_bathrooms', 'fewer_bathrooms'], 'bathrooms')
+        
+        # Market adjustment (see _apply_market_adjustment)
+        condition_ids = np.fromiter(
+            (_MARKET_CONDITION_IDS[c] for c in market_conditions), dtype=np.intp, count=n
+        )
+        market_adj_value = (base_land_value + building_value) * _MARKET_FACTOR_ARR[condition_ids]
+        
+        total_adjustments = bedroom_adj + bathroom_adj + location_premium + market_adj_value
+        estimated_value = base_land_value + building_value + total_adjustments
+        
+        # Confidence score and range (see _calculate_confidence_score and
+        # _calculate_confidence_range)
+        zone_flags = np.fromiter((info.flags for info in zone_infos), dtype=np.int64, count=n)
+        common_zone = (zone_flags & (_ZONE_RL | _ZONE_RM)) != 0
+        confidence_score = np.clip(
+            0.75 + common_zone * 0.10 - heritage_designated * 0.15 + (nearby_parks >= 2) * 0.05, 0.5, 0.95
+        )
+        range_factor = (1 - confidence_score) * 0.3
+        
+        # Days on market (see _estimate_days_on_market)
+        premium_zone = (zone_flags & _ZONE_PREMIUM_RL) != 0
+        medium_density = (zone_flags & _ZONE_RM) != 0
+        days_on_market = (
+            _BASE_DAYS_ON_MARKET_ARR[condition_ids]
+            + np.select([estimated_value > 2000000, estimated_value > 1500000, estimated_value < 800000], [21, 14, -7], 0)
+            + np.select([premium_zone, medium_density], [-7, 7], 0)
+        )
+        days_on_market = np.maximum(7, days_on_market)
+        
+        return ValuationColumns(
+            zone_code=zone_codes,
+            market_condition=market_conditions,
+            land_value=base_land_value,
+            building_value=building_value,
+            depreciation=depreciation,
+            location_premium=location_premium,
+            bedroom_key=bedroom_key,
+            bedroom_adjustment=bedroom_adj,
+            bathroom_key=bathroom_key,
+            bathroom_adjustment=bathroom_adj,
+            market_adjustment=market_adj_value,
+            total_adjustments=total_adjustments,
+            estimated_value=estimated_value,
+            confidence_score=confidence_score,
+            confidence_range_low=estimated_value * (1 - range_factor),
+            confidence_range_high=estimated_value * (1 + range_factor),
+            days_on_market=days_on_market,
+            heritage_designated=heritage_designated,
+            waterfront=waterfront
+        )
+    
     def _parse_base_zone(self, zone_code: str) -> str:
         """Extract base zone from complex zone code"""
-        # Remove special provisions and suffix zones
-        clean_zone = zone_code.split(' ')[0].split('-')[0]
-        return clean_zone
+        # Remove special provisions and suffix zones (cached; zone codes repeat)
+        return _parse_zone(zone_code).base_zone
     
-    def _calculate_building_value(self, building_area: float, building_type: str, 
-                                 age_years: int, renovation_year: Optional[int]) -> float:
-        """Calculate building value with depreciation"""
+    def _calculate_building_and_depreciation(self, building_area: float, building_type: str,
+                                             age_years: int, renovation_year: Optional[int],
+                                             current_year: Optional[int] = None) -> Tuple[float, float]:
+        """
+        Calculate depreciated building value and the depreciation amount
+        (negative value) from one rate lookup
+        """
         base_value_per_sqm = self.building_values.get(building_type, 2800)
         base_building_value = building_area * base_value_per_sqm
         
-        # Apply age depreciation
-        effective_age = age_years
+        # Depreciation amount uses actual age, capped at 40 years and 70%
+        depreciation_years = min(age_years, Config.MAX_DEPRECIATION_YEARS)
+        depreciation_amount = min(base_building_value * depreciation_years * self.depreciation_rate,
+                                  base_building_value * 0.7)
+        
+        # Building value depreciates by effective age
         if renovation_year:
-            current_year = datetime.now().year
-            years_since_reno = current_year - renovation_year
+            years_since_reno = (current_year or datetime.now().year) - renovation_year
             # Use lesser of actual age or years since major renovation
-            effective_age = min(age_years, years_since_reno)
-        
-        # Cap depreciation at 40 years
-        depreciation_years = min(effective_age, Config.MAX_DEPRECIATION_YEARS)
+            depreciation_years = min(depreciation_years, years_since_reno)
         depreciation_factor = 1 - (depreciation_years * self.depreciation_rate)
         depreciation_factor = max(0.3, depreciation_factor)  # Don't depreciate below 30%
         
-        return base_building_value * depreciation_factor
-    
-    def _calculate_depreciation(self, building_area: float, building_type: str, age_years: int) -> float:
-        """Calculate depreciation amount (negative value)"""
-        base_value_per_sqm = self.building_values.get(building_type, 2800)
-        base_building_value = building_area * base_value_per_sqm
-        
-        depreciation_years = min(age_years, Config.MAX_DEPRECIATION_YEARS)
-        depreciation_amount = base_building_value * depreciation_years * self.depreciation_rate
-        
-        return -min(depreciation_amount, base_building_value * 0.7)  # Max 70% depreciation
+        return base_building_value * depreciation_factor, -depreciation_amount
     
     def _calculate_feature_adjustments(self, base_land_value: float, 
-                                     bedrooms: int, bathrooms: float) -> Dict[str, float]:
-        """Calculate adjustments for property features"""
-        adjustments = {}
+                                     bedrooms: int, bathrooms: float) -> Tuple[float, Dict[str, float]]:
+        """
+        Calculate adjustments for property features
         
+        Returns:
+            (total feature adjustment, itemized adjustments)
+        """
         # Bedroom adjustments (premium for 4+ bedrooms, discount for fewer than 3)
         if bedrooms >= 4:
-            adjustments['extra_bedrooms'] = (bedrooms - 3) * 15000
+            bedroom_key, bedroom_adj = 'extra_bedrooms', (bedrooms - 3) * 15000
         elif bedrooms < 3:
-            adjustments['fewer_bedrooms'] = (bedrooms - 3) * 10000
+            bedroom_key, bedroom_adj = 'fewer_bedrooms', (bedrooms - 3) * 10000
         else:
-            adjustments['bedrooms'] = 0
+            bedroom_key, bedroom_adj = 'bedrooms', 0
         
         # Bathroom adjustments (premium for 3+ bathrooms)
         if bathrooms >= 3:
-            adjustments['extra_bathrooms'] = (bathrooms - 2.5) * 8000
+            bathroom_key, bathroom_adj = 'extra_bathrooms', (bathrooms - 2.5) * 8000
         elif bathrooms < 2:
-            adjustments['fewer_bathrooms'] = (bathrooms - 2.5) * 6000
+            bathroom_key, bathroom_adj = 'fewer_bathrooms', (bathrooms - 2.5) * 6000
         else:
-            adjustments['bathrooms'] = 0
+            bathroom_key, bathroom_adj = 'bathrooms', 0
         
-        return adjustments
+        return bedroom_adj + bathroom_adj, {bedroom_key: bedroom_adj, bathroom_key: bathroom_adj}
     
     def _calculate_location_adjustments(self, base_land_value: float,
                                       nearby_parks: int, nearby_schools: int,
                                       transit_distance: Optional[float],
                                       waterfront: bool, heritage_designated: bool,
-                                      is_corner: bool) -> Dict[str, float]:
-        """Calculate location-based adjustments"""
-        adjustments = {}
+                                      is_corner: bool,
+                                      detailed: bool = False) -> Tuple[float, Optional[Dict[str, float]]]:
+        """
+        Calculate location-based adjustments
         
-        # Park proximity premium
-        if nearby_parks > 0:
-            park_premium = min(nearby_parks * 0.02, 0.10)  # Max 10% premium
-            adjustments['parks'] = base_land_value * park_premium
+        Every adjustment is a percentage of land value, so they are summed
+        into one multiplier and applied once.
         
-        # School proximity premium
-        if nearby_schools > 0:
-            school_premium = min(nearby_schools * 0.015, 0.08)  # Max 8% premium
-            adjustments['schools'] = base_land_value * school_premium
+        Returns:
+            (total location premium, itemized adjustments if detailed else None)
+        """
+        # Park proximity premium (max 10%)
+        park_pct = min(nearby_parks * 0.02, 0.10) if nearby_parks > 0 else 0.0
+        
+        # School proximity premium (max 8%)
+        school_pct = min(nearby_schools * 0.015, 0.08) if nearby_schools > 0 else 0.0
         
         # Transit accessibility
-        if transit_distance is not None:
-            if transit_distance <= 500:  # Within 500m
-                adjustments['transit'] = base_land_value * 0.12
-            elif transit_distance <= 1000:  # Within 1km
-                adjustments['transit'] = base_land_value * 0.06
-            else:
-                adjustments['transit'] = 0
+        if transit_distance is None:
+            transit_pct = 0.0
+        elif transit_distance <= 500:  # Within 500m
+            transit_pct = 0.12
+        elif transit_distance <= 1000:  # Within 1km
+            transit_pct = 0.06
+        else:
+            transit_pct = 0.0
         
         # Special location factors
-        if waterfront:
-            adjustments['waterfront'] = base_land_value * self.location_factors['waterfront']
-        
-        if heritage_designated:
-            adjustments['heritage'] = base_land_value * self.location_factors['heritage_designated']
-        
-        if is_corner:
-            adjustments['corner_lot'] = base_land_value * self.location_factors['corner_lot']
+        waterfront_pct = self.location_factors['waterfront'] if waterfront else 0.0
+        heritage_pct = self.location_factors['heritage_designated'] if heritage_designated else 0.0
+        corner_pct = self.location_factors['corner_lot'] if is_corner else 0.0
         
-        return adjustments
+        location_premium = base_land_value * (
+            park_pct + school_pct + transit_pct + waterfront_pct + heritage_pct + corner_pct
+        )
+        if not detailed:
+            return location_premium, None
+        
+        items = (
+            ('parks', nearby_parks > 0, park_pct),
+            ('schools', nearby_schools > 0, school_pct),
+            ('transit', transit_distance is not None, transit_pct),
+            ('waterfront', waterfront, waterfront_pct),
+            ('heritage', heritage_designated, heritage_pct),
+            ('corner_lot', is_corner, corner_pct)
+        )
+        return location_premium, {name: base_land_value * pct for name, applies, pct in items if applies}
     
     def _apply_market_adjustment(self, base_value: float, market_condition: MarketCondition) -> float:
         """Apply market condition adjustment"""
-        if market_condition == MarketCondition.HOT:
-            return base_value * 0.08  # 8% premium
-        elif market_condition == MarketCondition.COOL:
-            return base_value * -0.05  # 5% discount
-        elif market_condition == MarketCondition.DECLINING:
-            return base_value * -0.12  # 12% discount
-        else:  # Balanced
-            return base_value * 0.02  # 2% moderate premium
+        return base_value * _MARKET_FACTORS.get(market_condition, _MARKET_FACTORS[MarketCondition.BALANCED])
     
     def _calculate_confidence_score(self, zone_code: str, nearby_parks: int, 
                                    heritage_designated: bool) -> float:
@@ -290,7 +733,7 @@ class PropertyValuator:
         base_confidence = 0.75
         
         # Higher confidence for common residential zones
-        if zone_code.startswith(('RL', 'RM')):
+        if _parse_zone(zone_code).flags & (_ZONE_RL | _ZONE_RM):
             base_confidence += 0.10
         
         # Lower confidence for unusual zones or heritage properties
@@ -316,15 +759,8 @@ class PropertyValuator:
     def _estimate_days_on_market(self, estimated_value: float, market_condition: MarketCondition, 
                                 zone_code: str) -> int:
         """Estimate days on market based on value and market conditions"""
-        base_days = 28  # Base estimate
-        
-        # Market condition adjustments
-        if market_condition == MarketCondition.HOT:
-            base_days = 14
-        elif market_condition == MarketCondition.COOL:
-            base_days = 42
-        elif market_condition == MarketCondition.DECLINING:
-            base_days = 65
+        # Base estimate by market condition
+        base_days = _BASE_DAYS_ON_MARKET.get(market_condition, _BASE_DAYS_ON_MARKET[MarketCondition.BALANCED])
         
         # Price range adjustments
         if estimated_value > 2000000:  # Luxury market
@@ -335,9 +771,10 @@ class PropertyValuator:
             base_days -= 7
         
         # Zone desirability
-        if zone_code in ['RL1', 'RL2']:  # Premium zones
+        zone_flags = _parse_zone(zone_code).flags
+        if zone_flags & _ZONE_PREMIUM_RL:  # Premium zones
             base_days -= 7
-        elif zone_code.startswith('RM'):  # Medium density
+        elif zone_flags & _ZONE_RM:  # Medium density
             base_days += 7
         
         return max(7, base_days)  # Minimum 1 week
@@ -345,21 +782,7 @@ class PropertyValuator:
     def _generate_valuation_notes(self, zone_code: str, heritage_designated: bool, 
                                  waterfront: bool) -> List[str]:
         """Generate valuation notes and disclaimers"""
-        notes = []
-        
-        if heritage_designated:
-            notes.append("Heritage designation may restrict development and affect value")
-        
-        if waterfront:
-            notes.append("Waterfront premium applied - verify actual water access")
-        
-        if '-0' in zone_code:
-            notes.append("Subject to -0 suffix zone restrictions affecting development potential")
-        
-        notes.append("Valuation is estimate only - professional appraisal recommended")
-        notes.append("Market conditions subject to change - values updated monthly")
-        
-        return notes
+        return _valuation_notes(zone_code, heritage_designated, waterfront)
     
     def calculate_development_value(self, zone_code: str, lot_area: float,
                                    development_potential: DevelopmentPotential,
@@ -542,15 +965,16 @@ class PropertyValuator:
     def _identify_development_risks(self, zone_code: str, units: int) -> List[str]:
         """Identify development risk factors"""
         risks = []
+        zone_flags = _parse_zone(zone_code).flags
         
-        if '-0' in zone_code:
+        if zone_flags & _ZONE_SUFFIX_0:
             risks.append("Suffix zone restrictions may limit development")
         
         if units > 10:
             risks.append("Large project requires experienced developer")
             risks.append("Market absorption risk for multiple units")
         
-        if zone_code.startswith('RM'):
+        if zone_flags & _ZONE_RM:
             risks.append("Medium density requires higher construction standards")
         
         risks.extend([
@@ -708,22 +1132,22 @@ class PropertyValuator:
             'zone_code': zone_code,
             'lot_dimensions': {
                 'area_sqm': lot_area,
-                'area_sqft': lot_area * 10.764,
+                'area_sqft': lot_area * M2_TO_FT2,
                 'frontage_m': lot_frontage,
-                'frontage_ft': lot_frontage * 3.281,
+                'frontage_ft': lot_frontage * M_TO_FT,
                 'depth_m': lot_depth,
-                'depth_ft': lot_depth * 3.281
+                'depth_ft': lot_depth * M_TO_FT
             },
             'zoning_analysis': {
                 'development_potential': development_potential,
                 'precise_setbacks': precise_setbacks,
                 'max_floor_area_ratio': precise_far,
                 'max_floor_area_sqm': development_potential.max_floor_area,
-                'max_floor_area_sqft': development_potential.max_floor_area * 10.764,
+                'max_floor_area_sqft': development_potential.max_floor_area * M2_TO_FT2,
                 'max_building_footprint_sqm': development_potential.max_building_footprint,
-                'max_building_footprint_sqft': development_potential.max_building_footprint * 10.764,
+                'max_building_footprint_sqft': development_potential.max_building_footprint * M2_TO_FT2,
                 'buildable_area_sqm': development_potential.buildable_area,
-                'buildable_area_sqft': development_potential.buildable_area * 10.764
+                'buildable_area_sqft': development_potential.buildable_area * M2_TO_FT2
             },
             'valuation_scenarios': scenarios,
             'highest_and_best_use': {
@@ -754,29 +1178,19 @@ class PropertyValuator:
     def _calculate_redevelopment_value(self, zone_code: str, lot_area: float, 
                                      development_potential, current_value: float) -> Dict[str, float]:
         """Calculate redevelopment value for single family home"""
-        max_floor_area = development_potential.max_floor_area
-        
-        # Construction costs
-        construction_cost_per_sqm = ZoningConfig.CONSTRUCTION_COSTS.get('detached_dwelling', 2500)
-        hard_costs = max_floor_area * construction_cost_per_sqm
-        soft_costs = hard_costs * ZoningConfig.SOFT_COST_PERCENTAGES['total']
-        
-        # Land costs (acquisition + demolition)
-        land_costs = current_value + 50000  # Assume $50k demolition
-        
-        total_development_cost = land_costs + hard_costs + soft_costs
-        
-        # Revenue calculation
+        # Revenue price with market and zone premiums
         base_zone = self._parse_base_zone(zone_code)
         price_per_sqm = self.building_values.get('detached_dwelling', 2800) * 1.5  # Market premium
-        
-        # Apply zone premium
-        zone_premiums = {'RL1': 1.2, 'RL2': 1.15, 'RL3': 1.1, 'RL4': 1.05, 'RL5': 1.05, 'RL6': 1.0}
-        price_per_sqm *= zone_premiums.get(base_zone, 1.0)
-        
-        gross_revenue = max_floor_area * price_per_sqm
-        gross_profit = gross_revenue - total_development_cost
-        profit_margin = gross_profit / gross_revenue if gross_revenue > 0 else 0
+        price_per_sqm *= _REDEVELOPMENT_ZONE_PREMIUMS.get(base_zone, 1.0)
+        
+        (gross_revenue, total_development_cost, gross_profit, profit_margin,
+         land_costs, construction_costs) = _redevelopment_core(
+            float(development_potential.max_floor_area),
+            float(ZoningConfig.CONSTRUCTION_COSTS.get('detached_dwelling', 2500)),
+            float(ZoningConfig.SOFT_COST_PERCENTAGES['total']),
+            float(current_value),
+            float(price_per_sqm)
+        )
         
         return {
             'gross_development_value': gross_revenue,
@@ -784,7 +1198,7 @@ class PropertyValuator:
             'gross_profit': gross_profit,
             'profit_margin': profit_margin,
             'land_costs': land_costs,
-            'construction_costs': hard_costs + soft_costs,
+            'construction_costs': construction_costs,
             'feasible': profit_margin >= 0.15  # 15% minimum margin
         }
     
@@ -821,7 +1235,7 @@ class PropertyValuator:
             'units': units,
             'avg_unit_price': avg_unit_price,
             'avg_unit_size_sqm': avg_unit_size,
-            'avg_unit_size_sqft': avg_unit_size * 10.764,
+            'avg_unit_size_sqft': avg_unit_size * M2_TO_FT2,
             'feasible': profit_margin >= 0.20  # 20% minimum margin for multi-unit
         }
     
@@ -830,7 +1244,7 @@ class PropertyValuator:
         confidence_factors = {
             'zoning_certainty': 0.9 if not development_potential.constraints else 0.7,
             'market_data_quality': 0.8,  # Would be based on actual comparable data
-            'regulatory_risk': 0.9 if '-0' not in zone_code else 0.7,
+            'regulatory_risk': 0.9 if not _parse_zone(zone_code).flags & _ZONE_SUFFIX_0 else 0.7,
             'development_complexity': 0.9 if development_potential.potential_units == 1 else 0.6
         }
         
@@ -90,6 +90,7 @@ class Config:
     REQUEST_TIMEOUT = 30  # seconds
     MAX_RETRIES = 3
     RETRY_DELAY = 1  # seconds
+    MAX_REQUESTS_PER_SECOND = 10  # Client-side throttle for ArcGIS hosts
     
     # Validation Limits
     MIN_LOT_AREA = 100.0  # square meters
@@ -621,10 +621,14 @@ class CacheManager:
 
 
 # Decorator for automatic caching
-def cached(cache_type: str = 'api_response', ttl: int = None, key_prefix: str = None):
+def cached(cache_type: str = 'api_response', ttl: int = None, key_prefix: str = None,
+           key_fn: Callable[..., Any] = None):
     """
     Decorator for automatic function result caching
     
+    key_fn, if given, maps the call arguments (without 'self') to the value
+    hashed into the cache key, e.g. to quantise coordinates
+    
     Usage:
         @cached(cache_type='zoning', ttl=7200)
         def get_zoning_info(lat, lon):
@@ -642,10 +646,11 @@ def cached(cache_type: str = 'api_response', ttl: int = None, key_prefix: str =
             prefix = key_prefix or f"{func.__module__}.{func.__name__}"
             # Skip first argument if it looks like 'self' (instance method)
             cache_args = args[1:] if args and hasattr(args[0], '__class__') else args
-            cache_key = wrapper._cache_manager._generate_key(
-                prefix, 
-                {'args': cache_args, 'kwargs': kwargs}
-            )
+            if key_fn is not None:
+                key_params = key_fn(*cache_args, **kwargs)
+            else:
+                key_params = {'args': cache_args, 'kwargs': kwargs}
+            cache_key = wrapper._cache_manager._generate_key(prefix, key_params)
             
             # Check cache first
             cached_result = wrapper._cache_manager.get(cache_key)